@@ -1,37 +1,186 @@
 """Top-level API router for Hybrid backend."""
-from datetime import date
+import hashlib
+import uuid
+from datetime import date, timedelta
+from typing import Annotated, Iterable
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from anyio import to_thread
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 
-from app.dependencies import get_snowflake_service
+from app.dependencies import DEFAULT_USER_ID, get_response_cache, get_snowflake_service
 from app.schemas.activity import Activity, ActivityCreate, ActivityUpdate
 from app.schemas.muscle import MuscleLoadResponse
 from app.schemas.sport import Sport
 from app.schemas.week import PeriodSummary, WeekSummary
+from app.services.cache import ResponseCache
+from app.services.dates import start_of_week
 from app.services.errors import SnowflakeServiceError
 from app.services.snowflake import SnowflakeService
 
 api_router = APIRouter()
 
+# Past weeks only change when an activity is edited, which invalidates the cache.
+HISTORIC_WEEK_TTL_SECONDS = 86400
+CURRENT_WEEK_TTL_SECONDS = 60
+# A week's muscle-load reads the four preceding weeks as its chronic window,
+# so one activity affects its own week plus the next four.
+MUSCLE_LOAD_CHRONIC_WEEKS = 4
+SPORTS_CACHE_KEY = "sports:v1"
+SPORTS_CACHE_TTL_SECONDS = 3600
+# Upper bound on one bulk import; the service splits it into batched requests.
+MAX_BULK_ACTIVITIES = 1000
+# Every activity write replaces the user's data version, so week and
+# muscle-load ETags built from it can be checked before touching Snowflake.
+# The TTL bounds how long edits made outside the API can go unnoticed.
+DATA_VERSION_TTL_SECONDS = HISTORIC_WEEK_TTL_SECONDS
+
+# Handlers serialize through prebuilt adapters and return raw JSON bytes, so
+# FastAPI skips re-validating the response model on every request. The
+# ``response_model`` declarations are kept for the OpenAPI schema.
+_SPORTS_ADAPTER = TypeAdapter(list[Sport])
+_WEEK_ADAPTER = TypeAdapter(WeekSummary)
+_MUSCLE_LOAD_ADAPTER = TypeAdapter(MuscleLoadResponse)
+
+
+def _week_cache_ttl(week_start_date: date) -> int:
+    if week_start_date <= date.today() - timedelta(days=7):
+        return HISTORIC_WEEK_TTL_SECONDS
+    return CURRENT_WEEK_TTL_SECONDS
+
+
+# Body keys carry the data version the read started under, so a read that
+# overlaps a write can only store its (possibly pre-write) body under the old
+# version, which no reader looks up once the write has bumped it.
+def _week_key(week_start_date: date, version: str) -> str:
+    return f"week:{DEFAULT_USER_ID}:{start_of_week(week_start_date).isoformat()}:{version}"
+
+
+def _muscle_load_key(week_start_date: date, version: str) -> str:
+    return f"muscle-load:{DEFAULT_USER_ID}:{start_of_week(week_start_date).isoformat()}:{version}"
+
+
+def _affected_cache_keys(session_dates: Iterable[date], version: str) -> list[str]:
+    keys: set[str] = set()
+    for session_date in session_dates:
+        week_start = start_of_week(session_date)
+        keys.add(_week_key(week_start, version))
+        for offset in range(MUSCLE_LOAD_CHRONIC_WEEKS + 1):
+            keys.add(_muscle_load_key(week_start + timedelta(weeks=offset), version))
+    return sorted(keys)
+
+
+async def _expire_weeks(cache: ResponseCache, session_dates: Iterable[date]) -> None:
+    """Drop the cached weeks a write touched, then move the user to a new version."""
+    version = await _stored_data_version(cache)
+    if version is not None:
+        await cache.delete(*_affected_cache_keys(session_dates, version))
+    await _bump_data_version(cache)
+
+
+async def _invalidate_user_weeks(cache: ResponseCache) -> None:
+    """Drop every cached week for the user when the touched dates are unknown."""
+    await cache.invalidate(f"week:{DEFAULT_USER_ID}:*", f"muscle-load:{DEFAULT_USER_ID}:*")
+
+
+def _data_version_key() -> str:
+    return f"version:{DEFAULT_USER_ID}"
+
+
+async def _stored_data_version(cache: ResponseCache) -> str | None:
+    version = await cache.get(_data_version_key())
+    return version.decode() if version is not None else None
+
+
+async def _bump_data_version(cache: ResponseCache) -> None:
+    """Give the user's data a new version after a write has committed."""
+    await cache.set(_data_version_key(), uuid.uuid4().hex.encode(), DATA_VERSION_TTL_SECONDS)
+
+
+async def _current_data_version(cache: ResponseCache) -> str | None:
+    """Return the user's data version, or None if the cache cannot hold one.
+
+    A missing version is written before the caller queries, so any write that
+    commits afterwards replaces it and no tag outlives the data it covers.
+    """
+    version = await _stored_data_version(cache)
+    if version is None:
+        await _bump_data_version(cache)
+        # Read back: NullCache (or a failing Redis) keeps nothing.
+        version = await _stored_data_version(cache)
+    return version
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _version_etag(version: str) -> str:
+    return f'"v-{version}"'
+
+
+def _not_modified_response(request: Request, version: str | None) -> Response | None:
+    """Return a bare 304 when the client's tag matches ``version``, before any query."""
+    if version is None:
+        return None
+    etag = _version_etag(version)
+    if not _etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def _conditional_json_response(request: Request, body: bytes, version: str | None) -> Response:
+    """Return ``body`` with an ETag, or a bare 304 if the client already has it.
+
+    The tag comes from the data version when the cache holds one. Without a
+    cache backend it falls back to a hash of the body, which is only computed
+    after the query ran: that saves bandwidth, not Snowflake work.
+    """
+    if version is not None:
+        etag = _version_etag(version)
+    else:
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @api_router.get("/health")
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     """Simple readiness probe used by dev tooling."""
     return {"status": "ok"}
 
 
 @api_router.get("/sports", response_model=list[Sport])
-def list_sports(
+async def list_sports(
     service: SnowflakeService = Depends(get_snowflake_service),
-) -> list[Sport]:
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Return each sport and its configured focuses."""
+    cached = await cache.get(SPORTS_CACHE_KEY)
+    if cached is not None:
+        return _json_response(cached)
     try:
-        return service.get_sports()
+        sports = await to_thread.run_sync(service.get_sports)
     except SnowflakeServiceError as exc:  # pragma: no cover - fastapi handles HTTP
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
+    body = _SPORTS_ADAPTER.dump_json(sports)
+    await cache.set(SPORTS_CACHE_KEY, body, SPORTS_CACHE_TTL_SECONDS)
+    return _json_response(body)
 
 
 @api_router.post(
@@ -39,65 +188,115 @@ def list_sports(
     response_model=Activity,
     status_code=status.HTTP_201_CREATED,
 )
-def create_activity(
+async def create_activity(
     payload: ActivityCreate,
     service: SnowflakeService = Depends(get_snowflake_service),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> Activity:
     """Persist a single activity session."""
     try:
-        return service.create_activity(payload)
+        activity = await to_thread.run_sync(service.create_activity, payload)
+    except SnowflakeServiceError as exc:  # pragma: no cover - fastapi handles HTTP
+        status_code = exc.status_code or status.HTTP_400_BAD_REQUEST
+        raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+    await _expire_weeks(cache, [payload.date])
+    return activity
+
+
+@api_router.post(
+    "/activities/bulk",
+    response_model=list[Activity],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_activities_bulk(
+    payloads: Annotated[list[ActivityCreate], Body(max_length=MAX_BULK_ACTIVITIES)],
+    service: SnowflakeService = Depends(get_snowflake_service),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> list[Activity]:
+    """Persist several activity sessions (e.g. a week import) in one request."""
+    try:
+        activities = await to_thread.run_sync(service.create_activities_bulk, payloads)
     except SnowflakeServiceError as exc:  # pragma: no cover - fastapi handles HTTP
         status_code = exc.status_code or status.HTTP_400_BAD_REQUEST
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+    await _expire_weeks(cache, [payload.date for payload in payloads])
+    return activities
 
 
 @api_router.put(
     "/activities/{activity_id}",
     response_model=Activity,
 )
-def update_activity(
+async def update_activity(
     activity_id: int,
     payload: ActivityUpdate,
     service: SnowflakeService = Depends(get_snowflake_service),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> Activity:
     """Update an existing activity session."""
     try:
-        return service.update_activity(activity_id, payload)
+        activity = await to_thread.run_sync(service.update_activity, activity_id, payload)
     except SnowflakeServiceError as exc:  # pragma: no cover - fastapi handles HTTP
         status_code = exc.status_code or status.HTTP_404_NOT_FOUND
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+    # The activity's previous date is only known to the service.
+    await _invalidate_user_weeks(cache)
+    await _bump_data_version(cache)
+    return activity
 
 
 @api_router.delete(
     "/activities/{activity_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_activity(
+async def delete_activity(
     activity_id: int,
     service: SnowflakeService = Depends(get_snowflake_service),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> None:
     """Delete an existing activity session."""
     try:
-        service.delete_activity(activity_id)
+        await to_thread.run_sync(service.delete_activity, activity_id)
     except SnowflakeServiceError as exc:  # pragma: no cover - fastapi handles HTTP
         status_code = exc.status_code or status.HTTP_404_NOT_FOUND
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+    # The activity's previous date is only known to the service.
+    await _invalidate_user_weeks(cache)
+    await _bump_data_version(cache)
 
 
 @api_router.get("/week/{week_start_date}", response_model=WeekSummary)
-def read_week(
+async def read_week(
     week_start_date: date,
+    request: Request,
     service: SnowflakeService = Depends(get_snowflake_service),
-) -> WeekSummary:
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Return all activities plus stats for a week (Monday-start)."""
+    version = await _current_data_version(cache)
+    not_modified = _not_modified_response(request, version)
+    if not_modified is not None:
+        return not_modified
+    if version is None:
+        # No cache backend to hold bodies either; always query.
+        cache_key = None
+    else:
+        cache_key = _week_key(week_start_date, version)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _conditional_json_response(request, cached, version)
     try:
-        return service.get_week_summary(week_start_date)
+        summary = await to_thread.run_sync(service.get_week_summary, week_start_date)
     except SnowflakeServiceError as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    body = _WEEK_ADAPTER.dump_json(summary)
+    if cache_key is not None:
+        await cache.set(cache_key, body, _week_cache_ttl(week_start_date))
+    return _conditional_json_response(request, body, version)
 
 
 @api_router.get("/summary", response_model=PeriodSummary)
-def read_period_summary(
+async def read_period_summary(
     start_date: date | None = None,
     end_date: date | None = None,
     lifetime: bool = False,
@@ -105,22 +304,42 @@ def read_period_summary(
 ) -> PeriodSummary:
     """Return aggregates for a date range or lifetime."""
     try:
-        return service.get_period_summary(start_date, end_date, lifetime)
+        return await to_thread.run_sync(
+            service.get_period_summary, start_date, end_date, lifetime
+        )
     except SnowflakeServiceError as exc:
         status_code = exc.status_code or status.HTTP_400_BAD_REQUEST
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
 
 
 @api_router.get("/muscle-load/{week_start_date}", response_model=MuscleLoadResponse)
-def read_muscle_load(
+async def read_muscle_load(
     week_start_date: date,
+    request: Request,
     service: SnowflakeService = Depends(get_snowflake_service),
-) -> MuscleLoadResponse:
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Return load values for each muscle for the requested week."""
+    version = await _current_data_version(cache)
+    not_modified = _not_modified_response(request, version)
+    if not_modified is not None:
+        return not_modified
+    if version is None:
+        # No cache backend to hold bodies either; always query.
+        cache_key = None
+    else:
+        cache_key = _muscle_load_key(week_start_date, version)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _conditional_json_response(request, cached, version)
     try:
-        return service.get_muscle_load(week_start_date)
+        muscle_load = await to_thread.run_sync(service.get_muscle_load, week_start_date)
     except SnowflakeServiceError as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    body = _MUSCLE_LOAD_ADAPTER.dump_json(muscle_load)
+    if cache_key is not None:
+        await cache.set(cache_key, body, _week_cache_ttl(week_start_date))
+    return _conditional_json_response(request, body, version)
 
 
 
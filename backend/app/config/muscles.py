@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import math
+import sys
 from dataclasses import dataclass
-from typing import Dict, Final, Literal
+from functools import lru_cache
+from typing import Callable, Dict, Final, Literal, Sequence
 
 LoadCategory = Literal["white", "blue", "green", "yellow", "orange", "red"]
 
 TierLabel = Literal["A", "B", "C"]
 
-MUSCLE_TIERS: Final[Dict[str, TierLabel]] = {
+_CANONICAL_TIERS: Dict[str, TierLabel] = {
     "core": "A",
     "balance": "A",
     "mental": "A",
@@ -29,12 +32,17 @@ MUSCLE_TIERS: Final[Dict[str, TierLabel]] = {
     "triceps": "C",
     "tendons": "C",
 }
+# Intern the canonical names so lookups of normalized (interned) input hit the
+# identity fast path in dict key comparison.
+MUSCLE_TIERS: Final[Dict[str, TierLabel]] = {
+    sys.intern(name): tier for name, tier in _CANONICAL_TIERS.items()
+}
 
 _DEFAULT_TIER: Final[TierLabel] = "B"
 _MIN_ACWR_FOR_COLOR: Final[float] = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TierThreshold:
     cutoff: float
     inclusive: bool
@@ -63,7 +71,7 @@ _TIER_THRESHOLDS: Final[Dict[TierLabel, tuple[TierThreshold, ...]]] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FatigueThreshold:
     cutoff: float
     inclusive: bool
@@ -92,38 +100,107 @@ _FATIGUE_THRESHOLDS: Final[Dict[TierLabel, tuple[FatigueThreshold, ...]]] = {
 }
 
 
+def _cutoff_table(
+    thresholds: Sequence[TierThreshold | FatigueThreshold],
+) -> tuple[tuple[float, ...], tuple[LoadCategory, ...]]:
+    """Flatten thresholds into ascending, all-inclusive (cutoffs, colors).
+
+    Every cutoff is treated as inclusive: exclusive cutoffs are nudged down to
+    the previous representable float so ``value < cutoff`` becomes
+    ``value <= cutoff'``. Index 0 is the "no load" white bucket and the final
+    color (red) is returned when the value exceeds every cutoff.
+    """
+    cutoffs: list[float] = [_MIN_ACWR_FOR_COLOR]
+    colors: list[LoadCategory] = ["white"]
+    for threshold in thresholds:
+        cutoff = threshold.cutoff
+        cutoffs.append(cutoff if threshold.inclusive else math.nextafter(cutoff, -math.inf))
+        colors.append(threshold.color)
+    colors.append("red")
+    return tuple(cutoffs), tuple(colors)
+
+
+def _compile_classifier(
+    name: str, table: tuple[tuple[float, ...], tuple[LoadCategory, ...]]
+) -> Callable[[float], LoadCategory]:
+    """Generate a straight-line ``if value <= cutoff`` ladder for one tier.
+
+    Cutoffs are emitted as exact float literals, so the generated function is
+    equivalent to ``colors[bisect_left(cutoffs, value)]`` but runs about twice
+    as fast: every comparison is against a constant with no lookups.
+    """
+    cutoffs, colors = table
+    lines = [f"def {name}(value):"]
+    for cutoff, color in zip(cutoffs, colors):
+        lines.append(f"    if value <= {cutoff!r}: return {color!r}")
+    lines.append(f"    return {colors[-1]!r}")
+    namespace: Dict[str, object] = {}
+    exec(compile("\n".join(lines), f"<{name}>", "exec"), namespace)
+    return namespace[name]  # type: ignore[return-value]
+
+
+_ACWR_CLASSIFIERS: Final[Dict[TierLabel, Callable[[float], LoadCategory]]] = {
+    tier: _compile_classifier(f"_acwr_color_tier_{tier}", _cutoff_table(thresholds))
+    for tier, thresholds in _TIER_THRESHOLDS.items()
+}
+_FATIGUE_CLASSIFIERS: Final[Dict[TierLabel, Callable[[float], LoadCategory]]] = {
+    tier: _compile_classifier(f"_fatigue_color_tier_{tier}", _cutoff_table(thresholds))
+    for tier, thresholds in _FATIGUE_THRESHOLDS.items()
+}
+
+
 def normalize_muscle_name(name: str) -> str:
-    return name.strip().lower()
+    return sys.intern(name.strip().lower())
+
+
+@lru_cache(maxsize=256)
+def tier_for_muscle(muscle_name: str) -> TierLabel:
+    """Return the sensitivity tier for a (raw, un-normalized) muscle name."""
+    return MUSCLE_TIERS.get(normalize_muscle_name(muscle_name), _DEFAULT_TIER)
 
 
 def color_for_muscle(muscle_name: str, acwr: float) -> LoadCategory:
     """Return the color bucket for the provided muscle + ACWR reading."""
 
-    if acwr <= _MIN_ACWR_FOR_COLOR:
-        return "white"
-
-    tier = MUSCLE_TIERS.get(normalize_muscle_name(muscle_name), _DEFAULT_TIER)
-    for threshold in _TIER_THRESHOLDS[tier]:
-        if threshold.inclusive and acwr <= threshold.cutoff:
-            return threshold.color
-        if not threshold.inclusive and acwr < threshold.cutoff:
-            return threshold.color
-    return "red"
+    return _ACWR_CLASSIFIERS[tier_for_muscle(muscle_name)](acwr)
 
 
 def fatigue_color_for_muscle(muscle_name: str, fatigue_score: float) -> LoadCategory:
     """Return fatigue bucket for the provided muscle + raw load reading."""
 
-    if fatigue_score <= 0:
-        return "white"
+    return _FATIGUE_CLASSIFIERS[tier_for_muscle(muscle_name)](fatigue_score)
+
+
+def _colors_for_muscles(
+    classifiers: Dict[TierLabel, Callable[[float], LoadCategory]],
+    muscle_names: Sequence[str],
+    values: Sequence[float],
+) -> list[LoadCategory]:
+    if len(muscle_names) != len(values):
+        raise ValueError("muscle_names and values must be the same length")
+    tier_of = tier_for_muscle
+    return [classifiers[tier_of(name)](value) for name, value in zip(muscle_names, values)]
+
+
+def colors_for_muscles(muscle_names: Sequence[str], acwrs: Sequence[float]) -> list[LoadCategory]:
+    """Batch variant of ``color_for_muscle`` for a whole muscle-load payload."""
+    return _colors_for_muscles(_ACWR_CLASSIFIERS, muscle_names, acwrs)
+
 
-    tier = MUSCLE_TIERS.get(normalize_muscle_name(muscle_name), _DEFAULT_TIER)
-    for threshold in _FATIGUE_THRESHOLDS[tier]:
-        if threshold.inclusive and fatigue_score <= threshold.cutoff:
-            return threshold.color
-        if not threshold.inclusive and fatigue_score < threshold.cutoff:
-            return threshold.color
-    return "red"
+def fatigue_colors_for_muscles(
+    muscle_names: Sequence[str], fatigue_scores: Sequence[float]
+) -> list[LoadCategory]:
+    """Batch variant of ``fatigue_color_for_muscle``."""
+    return _colors_for_muscles(_FATIGUE_CLASSIFIERS, muscle_names, fatigue_scores)
 
 
-__all__ = ["MUSCLE_TIERS", "color_for_muscle", "fatigue_color_for_muscle", "LoadCategory", "TierLabel"]
+__all__ = [
+    "MUSCLE_TIERS",
+    "color_for_muscle",
+    "colors_for_muscles",
+    "fatigue_color_for_muscle",
+    "fatigue_colors_for_muscles",
+    "tier_for_muscle",
+    "LoadCategory",
+    "TierLabel",
+]
@@ -1,16 +1,22 @@
 """Connection helpers for Snowflake."""
 from __future__ import annotations
 
+import logging
 import os
-from dataclasses import dataclass
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
-from typing import Any
+from typing import Any, Callable, Dict
 
 from dotenv import load_dotenv
 import snowflake.connector
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class SnowflakeConfig:
@@ -30,6 +36,16 @@ def _require(name: str) -> str:
     return value
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise RuntimeError(f"Environment variable {name} must be an integer.") from exc
+
+
 @lru_cache(maxsize=1)
 def get_snowflake_config() -> SnowflakeConfig:
     """Read Snowflake credentials from environment once."""
@@ -44,17 +60,158 @@ def get_snowflake_config() -> SnowflakeConfig:
     )
 
 
+@lru_cache(maxsize=1)
+def _connect_kwargs() -> Dict[str, Any]:
+    """Snapshot the connector keyword arguments the first time they are needed."""
+    kwargs: Dict[str, Any] = {
+        key: value for key, value in asdict(get_snowflake_config()).items() if value is not None
+    }
+    # Pooled connections sit idle between requests; heartbeat the session so the
+    # auth token does not expire and force a re-login on the next acquire.
+    kwargs["client_session_keep_alive"] = True
+    # Repeated reads bind identical SQL text, so Snowflake's result cache can
+    # answer them without a warehouse until the underlying tables change. Pin
+    # it on in case the account default is off, and tag the session so hits
+    # are visible in QUERY_HISTORY.
+    kwargs["session_parameters"] = {
+        "USE_CACHED_RESULT": True,
+        "QUERY_TAG": os.getenv("SNOWFLAKE_QUERY_TAG") or "hybrid-api",
+    }
+    return kwargs
+
+
 def get_snowflake_connection() -> Any:
     """Create a new Snowflake connector connection."""
-    config = get_snowflake_config()
-    return snowflake.connector.connect(
-        account=config.account,
-        user=config.user,
-        password=config.password,
-        warehouse=config.warehouse,
-        database=config.database,
-        schema=config.schema,
-        role=config.role,
-    )
+    return snowflake.connector.connect(**_connect_kwargs())
+
+
+def _close_quietly(connection: Any) -> None:
+    try:
+        connection.close()
+    except Exception:  # pragma: no cover - best effort cleanup
+        logger.debug("Ignoring error while closing Snowflake connection", exc_info=True)
+
+
+@dataclass
+class _PooledConnection:
+    connection: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
 
 
+class SnowflakePool:
+    """Bounded pool of long-lived Snowflake connections.
+
+    Connections are handed out by ``acquire()`` and must be returned with
+    ``release()``. Idle connections are pre-pinged with ``SELECT 1`` before
+    reuse and recycled once they exceed ``pool_recycle`` seconds of age.
+    """
+
+    def __init__(
+        self,
+        creator: Callable[[], Any] = get_snowflake_connection,
+        *,
+        pool_size: int = 10,
+        max_overflow: int = 0,
+        pool_recycle: float = 3600.0,
+        pool_pre_ping: bool = True,
+        pre_ping_after: float = 60.0,
+        pool_timeout: float = 30.0,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if max_overflow < 0:
+            raise ValueError("max_overflow must not be negative")
+        self._creator = creator
+        self._pool_recycle = pool_recycle
+        self._pool_pre_ping = pool_pre_ping
+        self._pre_ping_after = pre_ping_after
+        self._pool_timeout = pool_timeout
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue(maxsize=pool_size)
+        self._max_connections = pool_size + max_overflow
+        self._capacity = threading.BoundedSemaphore(self._max_connections)
+        self._leased: Dict[int, _PooledConnection] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_connections(self) -> int:
+        """Most connections that can be checked out at once."""
+        return self._max_connections
+
+    def acquire(self) -> Any:
+        """Check out a live connection, opening a new one when none are idle."""
+        if not self._capacity.acquire(timeout=self._pool_timeout):
+            raise RuntimeError("Timed out waiting for a pooled Snowflake connection.")
+        try:
+            pooled = self._checkout()
+        except BaseException:
+            self._capacity.release()
+            raise
+        with self._lock:
+            self._leased[id(pooled.connection)] = pooled
+        return pooled.connection
+
+    def release(self, connection: Any) -> None:
+        """Return a connection to the pool (or close it if the pool is full)."""
+        with self._lock:
+            pooled = self._leased.pop(id(connection), None)
+        if pooled is None:
+            _close_quietly(connection)
+            return
+        try:
+            if connection.is_closed():
+                return
+            pooled.last_used = time.monotonic()
+            try:
+                self._idle.put_nowait(pooled)
+            except queue.Full:
+                _close_quietly(connection)
+        finally:
+            self._capacity.release()
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_quietly(pooled.connection)
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledConnection(self._creator())
+            if self._is_usable(pooled):
+                return pooled
+            _close_quietly(pooled.connection)
+
+    def _is_usable(self, pooled: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if self._pool_recycle >= 0 and now - pooled.created_at >= self._pool_recycle:
+            return False
+        if pooled.connection.is_closed():
+            return False
+        if self._pool_pre_ping and now - pooled.last_used >= self._pre_ping_after:
+            try:
+                cursor = pooled.connection.cursor()
+                try:
+                    cursor.execute("select 1")
+                finally:
+                    cursor.close()
+            except Exception:
+                logger.info("Discarding stale pooled Snowflake connection")
+                return False
+        return True
+
+
+@lru_cache(maxsize=1)
+def get_snowflake_pool() -> SnowflakePool:
+    """Return the process-wide Snowflake connection pool."""
+    return SnowflakePool(
+        pool_size=_env_int("SNOWFLAKE_POOL_SIZE", 10),
+        max_overflow=_env_int("SNOWFLAKE_POOL_MAX_OVERFLOW", 0),
+        pool_recycle=_env_int("SNOWFLAKE_POOL_RECYCLE", 3600),
+    )
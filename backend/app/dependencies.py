@@ -1,19 +1,49 @@
 """Shared FastAPI dependencies."""
+import os
 from functools import lru_cache
 
-from app.db.session import get_snowflake_connection
+from fastapi import Request
+
+from app.db.session import get_snowflake_pool
+from app.services.cache import MemoryCache, NullCache, RedisCache, ResponseCache
 from app.services.snowflake import SnowflakeService
 
 DEFAULT_USER_ID = 1
 
 
 @lru_cache(maxsize=1)
-def get_snowflake_service() -> SnowflakeService:
-    """Create a cached Snowflake service instance."""
+def build_snowflake_service() -> SnowflakeService:
+    """Create a cached Snowflake service backed by the shared connection pool."""
+    pool = get_snowflake_pool()
     return SnowflakeService(
-        connection_factory=get_snowflake_connection,
+        connection_factory=pool.acquire,
+        connection_release=pool.release,
         default_user_id=DEFAULT_USER_ID,
     )
 
 
+@lru_cache(maxsize=1)
+def build_response_cache() -> ResponseCache:
+    """Return the Redis response cache, an in-process one, or a no-op cache.
+
+    Redis is used when REDIS_URL is set. ``RESPONSE_CACHE=memory`` opts a
+    single-worker deployment into the in-process cache instead.
+    """
+    url = os.getenv("REDIS_URL")
+    if url:
+        return RedisCache.from_url(url)
+    if os.getenv("RESPONSE_CACHE", "").lower() == "memory":
+        return MemoryCache()
+    return NullCache()
+
+
+# ``create_app`` stores the shared instances on ``app.state``; these
+# dependencies read them back without touching the builders' caches, and are
+# ``async def`` so FastAPI resolves them on the event loop instead of its
+# threadpool.
+async def get_snowflake_service(request: Request) -> SnowflakeService:
+    return request.app.state.snowflake_service
+
 
+async def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
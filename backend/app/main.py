@@ -1,28 +1,58 @@
 """FastAPI application entrypoint for Hybrid backend."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import api_router
+from app.db.session import get_snowflake_pool
+from app.dependencies import build_response_cache, build_snowflake_service
+
+# Route handlers offload blocking Snowflake calls to worker threads, and each
+# one holds a pooled connection. Threads beyond the pool's capacity would only
+# block on its checkout, so size the limiter to the pool plus a few threads for
+# work that needs no connection (sync dependencies, file responses).
+NON_SNOWFLAKE_WORKER_THREADS = 8
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    pool = get_snowflake_pool()
+    limit = pool.max_connections + NON_SNOWFLAKE_WORKER_THREADS
+    to_thread.current_default_thread_limiter().total_tokens = limit
+    try:
+        yield
+    finally:
+        # Keep-alive sessions otherwise stay open until the process exits.
+        pool.close()
 
 
 def create_app() -> FastAPI:
     """Application factory to enable future customization and testing."""
-    app = FastAPI(title="Hybrid API", version="0.1.0")
+    app = FastAPI(
+        title="Hybrid API",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     # Allow Vite dev server to talk to the API during local development.
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:5173"],
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["content-type", "authorization"],
+        max_age=86400,
     )
 
+    app.state.snowflake_service = build_snowflake_service()
+    app.state.response_cache = build_response_cache()
     app.include_router(api_router, prefix="/api")
     return app
 
 
 app = create_app()
-
-
-
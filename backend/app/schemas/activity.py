@@ -1,8 +1,8 @@
 """Pydantic models for activity endpoints (placeholder for scaffold)."""
 from datetime import date
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActivityBase(BaseModel):
@@ -19,10 +19,14 @@ class ActivityBase(BaseModel):
 class ActivityCreate(ActivityBase):
     """Payload accepted by POST /activities."""
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ActivityUpdate(ActivityBase):
     """Payload accepted by PUT /activities/{activity_id}."""
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Activity(ActivityBase):
     """Model returned from activity endpoints."""
@@ -30,7 +34,23 @@ class Activity(ActivityBase):
     activity_id: int
     week_id: int
 
-    class Config:
-        orm_mode = True
-
-
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_db_row(cls, row: Sequence[Any], columns: Mapping[str, int]) -> "Activity":
+        """Build from an ``activity_sessions`` tuple row without validation.
+
+        ``columns`` maps lowercased column names to positions in ``row``. Rows
+        are already constrained by the table schema, so this trusted path uses
+        ``model_construct`` and only coerces Snowflake's NUMBER columns.
+        """
+        return cls.model_construct(
+            activity_id=int(row[columns["activity_id"]]),
+            week_id=int(row[columns["week_id"]]),
+            sport_id=int(row[columns["sport_id"]]),
+            date=row[columns["session_date"]],
+            category=row[columns["category"]],
+            duration_minutes=int(row[columns["duration_minutes"]]),
+            intensity_rpe=int(row[columns["intensity_rpe"]]),
+            notes=row[columns["notes"]],
+        )
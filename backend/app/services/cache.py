@@ -0,0 +1,122 @@
+"""Response caches for read-heavy endpoints."""
+from __future__ import annotations
+
+import fnmatch
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class NullCache:
+    """Cache stand-in used when no cache backend is configured."""
+
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        return None
+
+    async def delete(self, *keys: str) -> None:
+        return None
+
+    async def invalidate(self, *patterns: str) -> None:
+        return None
+
+
+class MemoryCache:
+    """Per-process LRU cache with a TTL, for single-worker deployments without Redis.
+
+    Invalidation only reaches the worker that handled the write, so TTLs are
+    capped at ``max_ttl_seconds`` to bound how stale other workers can get.
+    """
+
+    def __init__(self, max_entries: int = 256, max_ttl_seconds: int = 60) -> None:
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._max_ttl_seconds = max_ttl_seconds
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        ttl = min(ttl_seconds, self._max_ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def invalidate(self, *patterns: str) -> None:
+        for key in [key for key in self._entries if any(fnmatch.fnmatchcase(key, p) for p in patterns)]:
+            del self._entries[key]
+
+
+class RedisCache:
+    """Store serialized responses in Redis under a shared namespace.
+
+    Cache failures are logged and treated as misses so Redis outages never
+    break the API.
+    """
+
+    def __init__(self, client: Any, namespace: str = "hybrid") -> None:
+        self._client = client
+        self._namespace = namespace
+
+    @classmethod
+    def from_url(cls, url: str, namespace: str = "hybrid") -> "RedisCache":
+        return cls(aioredis.Redis.from_url(url), namespace=namespace)
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self._client.get(self._key(key))
+        except RedisError:
+            logger.warning("Redis GET failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        try:
+            await self._client.set(self._key(key), value, ex=ttl_seconds)
+        except RedisError:
+            logger.warning("Redis SET failed for %s", key, exc_info=True)
+
+    async def delete(self, *keys: str) -> None:
+        """Delete exact keys; prefer this over ``invalidate`` when keys are known."""
+        if not keys:
+            return
+        try:
+            await self._client.delete(*(self._key(key) for key in keys))
+        except RedisError:
+            logger.warning("Redis DEL failed for %s", keys, exc_info=True)
+
+    async def invalidate(self, *patterns: str) -> None:
+        """Delete every key matching the provided glob patterns (SCAN-based)."""
+        try:
+            for pattern in patterns:
+                keys = [key async for key in self._client.scan_iter(match=self._key(pattern))]
+                if keys:
+                    await self._client.delete(*keys)
+        except RedisError:
+            logger.warning("Redis invalidation failed for %s", patterns, exc_info=True)
+
+
+ResponseCache = NullCache | MemoryCache | RedisCache
@@ -0,0 +1,9 @@
+"""Calendar helpers shared by the API routes and the Snowflake service."""
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def start_of_week(target: date) -> date:
+    """Return the Monday of the week that contains the target date."""
+    return date.fromordinal(target.toordinal() - target.weekday())
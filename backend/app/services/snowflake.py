@@ -2,25 +2,511 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import date, timedelta
-from typing import Callable, Dict, Iterator, List, Set, Tuple
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, Sequence, Set, Tuple
 
-from snowflake.connector import DictCursor
+from snowflake.connector.cursor import SnowflakeCursor
 from snowflake.connector.errors import Error as SnowflakeConnectorError
 
-from app.config.muscles import color_for_muscle, fatigue_color_for_muscle
+from app.config.muscles import colors_for_muscles, fatigue_colors_for_muscles
 from app.schemas.activity import Activity, ActivityCreate, ActivityUpdate
 from app.schemas.muscle import AthleteProfile, MuscleLoad, MuscleLoadResponse
 from app.schemas.sport import Sport, SportFocus
 from app.schemas.week import PeriodSummary, SportBreakdown, WeekStats, WeekSummary
+from app.services.dates import start_of_week
 from app.services.errors import SnowflakeServiceError
-from app.services.load_formula import BASELINE_RPE, LoadInputs, muscle_load_score
+from app.services.load_formula import (
+    BASELINE_RPE,
+    EMPHASIS_FACTOR,
+    INTENSITY_MAX,
+    INTENSITY_MIN,
+    UNILATERAL_FACTOR,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Sport/focus metadata changes on the order of days; refresh it hourly.
+SPORTS_CACHE_TTL_SECONDS = 3600.0
+# sports / muscle_groups id -> name maps used to enrich join-free aggregates.
+REFERENCE_CACHE_TTL_SECONDS = 3600.0
+# A week's id never changes once created, so (week_id, label) lookups are kept
+# per process; the TTL only bounds how stale an edited label can get.
+WEEK_CACHE_TTL_SECONDS = 300.0
+WEEK_CACHE_MAX_ENTRIES = 512
+# Rows per multi-row INSERT request in ``create_activities_bulk``; larger
+# imports are split into several requests inside one transaction.
+BULK_INSERT_BATCH_SIZE = 200
+
+# Activity writes and single-row reads.
+_INSERT_ACTIVITY_SQL: Final[str] = """
+    insert into activity_sessions (
+        user_id,
+        week_id,
+        session_date,
+        sport_id,
+        category,
+        duration_minutes,
+        intensity_rpe,
+        notes
+    )
+    values (
+        %(user_id)s,
+        %(week_id)s,
+        %(session_date)s,
+        %(sport_id)s,
+        %(category)s,
+        %(duration_minutes)s,
+        %(intensity_rpe)s,
+        %(notes)s
+    )
+"""
+
+_INSERTED_ACTIVITY_ID_SQL: Final[str] = """
+    select activity_id
+    from activity_sessions
+    where user_id = %(user_id)s
+      and week_id = %(week_id)s
+      and session_date = %(session_date)s
+      and sport_id = %(sport_id)s
+      and duration_minutes = %(duration_minutes)s
+      and intensity_rpe = %(intensity_rpe)s
+      and category is not distinct from %(category)s
+      and notes is not distinct from %(notes)s
+    order by activity_id desc
+    limit 1
+"""
+
+# Bulk creates bind each row's values as ``%(row<i>_<column>)s``.
+_BULK_ACTIVITY_COLUMNS: Final[Tuple[str, ...]] = (
+    "week_id",
+    "session_date",
+    "sport_id",
+    "category",
+    "duration_minutes",
+    "intensity_rpe",
+    "notes",
+)
+
+
+def _bulk_row_binds(index: int) -> str:
+    return ", ".join(f"%(row{index}_{column})s" for column in _BULK_ACTIVITY_COLUMNS)
+
+
+def _bulk_insert_activities_sql(row_count: int) -> str:
+    """One multi-row INSERT for ``row_count`` bulk rows."""
+    rows = ",\n        ".join(f"(%(user_id)s, {_bulk_row_binds(index)})" for index in range(row_count))
+    return f"""
+    insert into activity_sessions (user_id, {", ".join(_BULK_ACTIVITY_COLUMNS)})
+    values
+        {rows}
+"""
+
+
+def _bulk_inserted_ids_sql(row_count: int) -> str:
+    """Read back one activity_id per bulk row, keyed by its index in the batch.
+
+    Rows are matched on their values like ``_INSERTED_ACTIVITY_ID_SQL``. The
+    k-th of several identical rows in a batch takes the k-th newest matching
+    id, so duplicates map one-to-one onto the rows just inserted.
+    """
+    rows = ",\n            ".join(f"({index}, {_bulk_row_binds(index)})" for index in range(row_count))
+    aliases = ", ".join(
+        f"column{position} as {column}" for position, column in enumerate(_BULK_ACTIVITY_COLUMNS, start=2)
+    )
+    return f"""
+    with batch as (
+        select column1 as row_index, {aliases}
+        from values
+            {rows}
+    ),
+    ranked as (
+        select
+            batch.*,
+            row_number() over (
+                partition by {", ".join(_BULK_ACTIVITY_COLUMNS)}
+                order by row_index
+            ) as duplicate_rank
+        from batch
+    )
+    select r.row_index, s.activity_id
+    from ranked r
+    join activity_sessions s
+      on s.user_id = %(user_id)s
+     and s.week_id = r.week_id
+     and s.session_date = r.session_date
+     and s.sport_id = r.sport_id
+     and s.duration_minutes = r.duration_minutes
+     and s.intensity_rpe = r.intensity_rpe
+     and s.category is not distinct from r.category
+     and s.notes is not distinct from r.notes
+    qualify row_number() over (partition by r.row_index order by s.activity_id desc) = r.duplicate_rank
+"""
+
+
+_UPDATE_ACTIVITY_SQL: Final[str] = """
+    update activity_sessions
+    set
+        week_id = %(week_id)s,
+        session_date = %(session_date)s,
+        sport_id = %(sport_id)s,
+        category = %(category)s,
+        duration_minutes = %(duration_minutes)s,
+        intensity_rpe = %(intensity_rpe)s,
+        notes = %(notes)s
+    where user_id = %(user_id)s
+      and activity_id = %(activity_id)s
+"""
+
+_DELETE_ACTIVITY_SQL: Final[str] = """
+    delete from activity_sessions
+    where user_id = %(user_id)s
+      and activity_id = %(activity_id)s
+"""
+
+_ACTIVITY_BY_ID_SQL: Final[str] = """
+    select
+        activity_id,
+        week_id,
+        session_date,
+        sport_id,
+        category,
+        duration_minutes,
+        intensity_rpe,
+        notes
+    from activity_sessions
+    where user_id = %(user_id)s
+      and activity_id = %(activity_id)s
+    limit 1
+"""
+
+_WEEK_BY_START_SQL: Final[str] = """
+    select week_id, week_start_date, label
+    from weeks
+    where user_id = %(user_id)s
+      and week_start_date = %(week_start_date)s
+"""
+
+# The window ends on the requested Monday, so an exact match sorts first and a
+# legacy (non-Monday) anchor from the same week is returned otherwise.
+_WEEK_IN_WINDOW_SQL: Final[str] = """
+    select week_id, week_start_date, label
+    from weeks
+    where user_id = %(user_id)s
+      and week_start_date between %(window_start)s and %(window_end)s
+    order by week_start_date desc
+    limit 1
+"""
+
+_REANCHOR_WEEK_SQL: Final[str] = """
+    update weeks
+    set week_start_date = %(week_start_date)s
+    where week_id = %(week_id)s
+"""
+
+_WEEK_MERGE_SQL: Final[str] = """
+    merge into weeks as target
+    using (select %(user_id)s as user_id, %(week_start_date)s as week_start_date) as source
+    on target.user_id = source.user_id and target.week_start_date = source.week_start_date
+    when not matched then insert (user_id, week_start_date)
+    values (source.user_id, source.week_start_date)
+"""
+
+# Range reads shared by the single-query helpers and the batched week/muscle-load
+# submissions. They bind %(user_id)s, %(start_date)s and %(end_date)s.
+_ACTIVITIES_BY_RANGE_SQL: Final[str] = """
+    select
+        activity_id,
+        week_id,
+        session_date,
+        sport_id,
+        category,
+        duration_minutes,
+        intensity_rpe,
+        notes
+    from activity_sessions
+    where user_id = %(user_id)s
+      and session_date between %(start_date)s and %(end_date)s
+    order by session_date asc, activity_id asc
+"""
+
+_STATS_BY_RANGE_SQL: Final[str] = """
+    select
+        coalesce(sum(duration_minutes), 0) as total_duration_minutes,
+        count(*) as session_count,
+        coalesce(avg(intensity_rpe), 0) as average_rpe
+    from activity_sessions
+    where user_id = %(user_id)s
+      and session_date between %(start_date)s and %(end_date)s
+"""
+
+_SPORT_BREAKDOWN_BY_RANGE_SQL: Final[str] = """
+    select
+        sport_id,
+        coalesce(sum(duration_minutes), 0) as total_duration_minutes,
+        count(activity_id) as session_count
+    from activity_sessions
+    where user_id = %(user_id)s
+      and session_date between %(start_date)s and %(end_date)s
+    group by sport_id
+    order by total_duration_minutes desc
+"""
+
+_ACTIVITY_DATE_BOUNDS_SQL: Final[str] = """
+    select min(session_date) as earliest_date, max(session_date) as latest_date
+    from activity_sessions
+    where user_id = %(user_id)s
+"""
+
+_SPORTS_WITH_FOCUSES_SQL: Final[str] = """
+    select
+        s.sport_id,
+        s.name as sport_name,
+        s.default_intensity_scale,
+        f.focus_id,
+        f.name as focus_name
+    from sports s
+    left join sport_focus f on f.sport_id = s.sport_id
+    order by s.sport_id asc, f.focus_id asc
+"""
+
+
+def _range_summary_sql(session_filter: str) -> str:
+    """Build the totals + per-sport breakdown scan for the user's sessions.
+
+    The ``()`` grouping set is the range total (is_total = 1) and
+    ``(sport_id)`` yields one row per sport.
+    """
+    return f"""
+    select
+        grouping(sport_id) as is_total,
+        sport_id,
+        coalesce(sum(duration_minutes), 0) as total_duration_minutes,
+        count(activity_id) as session_count,
+        coalesce(avg(intensity_rpe), 0) as average_rpe
+    from activity_sessions
+    where user_id = %(user_id)s
+      and {session_filter}
+    group by grouping sets ((), (sport_id))
+    order by is_total desc, total_duration_minutes desc
+"""
+
+
+_RANGE_SUMMARY_SQL: Final[str] = _range_summary_sql("session_date between %(start_date)s and %(end_date)s")
+# Lifetime spans every session, so it needs no date predicate and can share a
+# request with _ACTIVITY_DATE_BOUNDS_SQL instead of waiting on its result.
+_LIFETIME_SUMMARY_SQL: Final[str] = _range_summary_sql("true")
+
+_SPORT_NAMES_SQL: Final[str] = "select sport_id as id, name from sports"
+
+_MUSCLE_NAMES_SQL: Final[str] = "select muscle_id as id, name from muscle_groups"
+
+_FOCUS_IDS_SQL: Final[str] = "select sport_id, lower(name) as name, focus_id from sport_focus"
+
+# One config per muscle for every (sport, focus) an activity can resolve to,
+# including "no focus": the focus-specific row wins over the sport-wide one, as
+# in the daily-load SQL. ``for_focus_id`` is the focus the row was chosen for.
+_MUSCLE_LOAD_CONFIGS_SQL: Final[str] = """
+    with config_keys as (
+        select distinct sport_id, focus_id from sport_muscle_loads where focus_id is not null
+        union all
+        select distinct sport_id, null from sport_muscle_loads
+    )
+    select
+        k.sport_id,
+        k.focus_id as for_focus_id,
+        sml.muscle_id,
+        sml.base_load_per_minute,
+        sml.emphasis,
+        sml.unilateral,
+        sml.focus_id
+    from config_keys k
+    join sport_muscle_loads sml
+      on sml.sport_id = k.sport_id
+     and (sml.focus_id = k.focus_id or sml.focus_id is null)
+    qualify row_number() over (
+        partition by k.sport_id, k.focus_id, sml.muscle_id
+        order by case when sml.focus_id is null then 1 else 0 end
+    ) = 1
+"""
+
+# One pass over the 35-day window: acute sums the requested week, chronic the
+# four weeks before it. Only muscles with rows in the requested week are kept.
+_MUSCLE_LOAD_SQL: Final[str] = """
+    SELECT
+        muscle_id,
+        -- ACWR = acute / (chronic 4-week total / 4); without chronic history the
+        -- divisor falls back to max(acute, 1).
+        acute_load::FLOAT / CASE
+            WHEN chronic_load > 0 THEN chronic_load::FLOAT / 4
+            ELSE GREATEST(acute_load::FLOAT, 1.0)
+        END AS acwr
+    FROM (
+        SELECT
+            muscle_id,
+            COALESCE(SUM(IFF(date >= %(week_start)s, load_score, NULL)), 0) AS acute_load,
+            COALESCE(SUM(IFF(date <= %(chronic_end)s, load_score, NULL)), 0) AS chronic_load,
+            COUNT_IF(date >= %(week_start)s) AS acute_rows
+        FROM daily_muscle_loads
+        WHERE user_id = %(user_id)s
+          AND date BETWEEN %(chronic_start)s AND %(week_end)s
+        GROUP BY muscle_id
+    )
+    WHERE acute_rows > 0
+    ORDER BY acute_load DESC
+"""
+
+_ATHLETE_PROFILE_SQL: Final[str] = """
+    select height_cm, weight_kg, date_of_birth
+    from users
+    where user_id = %(user_id)s
+    limit 1
+"""
+
+_DELETE_DAILY_LOADS_BY_RANGE_SQL: Final[str] = """
+    delete from daily_muscle_loads
+    where user_id = %(user_id)s
+      and date between %(start_date)s and %(end_date)s
+"""
+
+# ``%(session_dates)s`` binds a list of ISO date strings; pyformat expands it to
+# a comma-separated literal list.
+_DELETE_DAILY_LOADS_FOR_DATES_SQL: Final[str] = """
+    delete from daily_muscle_loads
+    where user_id = %(user_id)s
+      and date in (%(session_dates)s)
+"""
+
+# ``str.strip()``'s ASCII whitespace as a Snowflake TRIM character list, so
+# the SQL focus match trims categories the way ``_resolve_focus_id`` does.
+_CATEGORY_WHITESPACE_SQL: Final[str] = "' \\t\\n\\x0b\\f\\r'"
+
+
+def _daily_loads_insert_sql(session_filter: str) -> str:
+    """Build the daily-load recompute for the sessions matching ``session_filter``.
+
+    This is the only place daily loads are computed: create, bulk create,
+    update/delete refreshes and the rebuild all run it, so every path
+    resolves focus, picks configs and weights emphasis the same way. Each
+    activity's focus is resolved like ``_resolve_focus_id``, the
+    focus-specific config wins per muscle, and the formula factors come from
+    app.services.load_formula. Any non-empty emphasis descriptor counts as
+    emphasised. A muscle whose chosen config has a NULL or non-positive base
+    load drops out after the QUALIFY (``load_score > 0``) rather than falling
+    back to the sport-wide row.
+    """
+    return f"""
+    insert into daily_muscle_loads (user_id, week_id, date, muscle_id, load_score)
+    select user_id, max(week_id), session_date, muscle_id, sum(load_score)
+    from (
+        select
+            a.user_id,
+            a.week_id,
+            a.session_date,
+            sml.muscle_id,
+            a.duration_minutes
+                * sml.base_load_per_minute
+                * least(greatest(a.intensity_rpe / {BASELINE_RPE!r}, {INTENSITY_MIN!r}), {INTENSITY_MAX!r})
+                * iff(coalesce(sml.unilateral, false), {UNILATERAL_FACTOR!r}, 1.0)
+                * iff(coalesce(to_varchar(sml.emphasis), '') <> '', {EMPHASIS_FACTOR!r}, 1.0) as load_score
+        from (
+            select
+                s.activity_id,
+                s.user_id,
+                s.week_id,
+                s.session_date,
+                s.sport_id,
+                s.duration_minutes,
+                s.intensity_rpe,
+                min(f.focus_id) as focus_id
+            from activity_sessions s
+            left join sport_focus f
+              on f.sport_id = s.sport_id
+             and lower(f.name) = lower(trim(s.category, {_CATEGORY_WHITESPACE_SQL}))
+            where s.user_id = %(user_id)s
+              and {session_filter}
+            group by 1, 2, 3, 4, 5, 6, 7
+        ) a
+        join sport_muscle_loads sml
+          on sml.sport_id = a.sport_id
+         and (sml.focus_id = a.focus_id or sml.focus_id is null)
+        qualify row_number() over (
+            partition by a.activity_id, sml.muscle_id
+            order by case when sml.focus_id is null then 1 else 0 end
+        ) = 1
+    ) contributions
+    where load_score > 0
+    group by user_id, session_date, muscle_id
+"""
+
+
+_REBUILD_DAILY_LOADS_SQL: Final[str] = _daily_loads_insert_sql(
+    "s.session_date between %(start_date)s and %(end_date)s"
+)
+_REFRESH_DAILY_LOADS_SQL: Final[str] = _daily_loads_insert_sql("s.session_date in (%(session_dates)s)")
+
+# Create, bulk create, update and delete all recompute the touched dates with
+# this pair so they share the rebuild's rule.
+_RECOMPUTE_DAILY_LOADS_FOR_DATES: Final[Tuple[str, str]] = (
+    _DELETE_DAILY_LOADS_FOR_DATES_SQL,
+    _REFRESH_DAILY_LOADS_SQL,
+)
+
+# Rows come back as plain tuples; ``columns`` maps each lowercased column name
+# to its position so readers index rows directly instead of building dicts.
+ResultSet = Tuple[Dict[str, int], List[Tuple[Any, ...]]]
+# Same shape, but rows may be a live cursor that is consumed exactly once.
+RowStream = Tuple[Dict[str, int], Iterable[Tuple[Any, ...]]]
+# One sport_muscle_loads row keyed by lowercased column name.
+MuscleConfig = Dict[str, object]
+
+
+def _close_connection(connection: object) -> None:
+    connection.close()
+
+
+def _columns(cursor: SnowflakeCursor) -> Dict[str, int]:
+    return {column[0].lower(): position for position, column in enumerate(cursor.description or ())}
+
+
+def _read_result(cursor: SnowflakeCursor) -> ResultSet:
+    """Fetch the current result set along with its column positions."""
+    return _columns(cursor), cursor.fetchall() or []
+
+
+def _stream_result(cursor: SnowflakeCursor) -> RowStream:
+    """Return column positions plus the cursor itself for streaming iteration.
+
+    The connector downloads result chunks lazily as the cursor is iterated,
+    so mapping rows while iterating avoids holding every raw tuple in memory
+    alongside the mapped models. Consume it before the next ``execute``.
+    """
+    return _columns(cursor), cursor
+
+
+def _materialize(result: RowStream) -> ResultSet:
+    """Read a streamed result set into memory (for small, re-read sets)."""
+    columns, rows = result
+    return columns, list(rows)
+
+
+def _session_dates_param(dates: Iterable[date]) -> List[str]:
+    """Bind value for ``%(session_dates)s``: sorted ISO date strings."""
+    return [target_date.isoformat() for target_date in sorted(dates)]
+
+
+def _first_row(result: ResultSet) -> Dict[str, Any] | None:
+    """Return the first row of a result set keyed by lowercased column name."""
+    columns, rows = result
+    if not rows:
+        return None
+    row = rows[0]
+    return {name: row[position] for name, position in columns.items()}
+
 
 class SnowflakeService:
     """Wrapper that translates API calls into Snowflake SQL statements."""
@@ -29,93 +515,128 @@ class SnowflakeService:
         self,
         connection_factory: Callable[[], object],
         default_user_id: int,
+        connection_release: Callable[[object], None] | None = None,
     ) -> None:
         self._connection_factory = connection_factory
+        self._connection_release = connection_release or _close_connection
         self._default_user_id = default_user_id
+        self._sports_cache: Tuple[float, List[Sport]] | None = None
+        self._sports_lock = threading.Lock()
+        self._week_cache: "OrderedDict[Tuple[int, date], Tuple[float, Tuple[int, str | None]]]" = OrderedDict()
+        self._week_cache_lock = threading.Lock()
+        self._reference_names: Dict[str, Tuple[float, Dict[int, str]]] = {}
+        self._focus_ids: Tuple[float, Dict[Tuple[int, str], int]] | None = None
+        # (loaded_at, resolved configs by (sport_id, focus_id))
+        self._muscle_configs: Tuple[float, Dict[Tuple[int, int | None], List[MuscleConfig]]] | None = None
 
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
     def create_activity(self, payload: ActivityCreate) -> Activity:
         """Persist a new activity session for the default user."""
-        week_start = self._start_of_week(payload.date)
+        week_start = start_of_week(payload.date)
         with self._cursor() as cursor:
             week_id, _ = self._upsert_week(cursor, week_start)
 
-            insert_sql = """
-                insert into activity_sessions (
-                    user_id,
-                    week_id,
-                    session_date,
-                    sport_id,
-                    category,
-                    duration_minutes,
-                    intensity_rpe,
-                    notes
-                )
-                values (
-                    %(user_id)s,
-                    %(week_id)s,
-                    %(session_date)s,
-                    %(sport_id)s,
-                    %(category)s,
-                    %(duration_minutes)s,
-                    %(intensity_rpe)s,
-                    %(notes)s
-                )
-            """
-            activity_params = {
-                    "user_id": self._default_user_id,
-                    "week_id": week_id,
-                    "session_date": payload.date,
-                    "sport_id": payload.sport_id,
-                    "category": payload.category,
-                    "duration_minutes": payload.duration_minutes,
-                    "intensity_rpe": payload.intensity_rpe,
-                    "notes": payload.notes,
+            # Send the INSERT, the id read-back and the day's load recompute as one
+            # transactional request. Snowflake has no RETURNING, and RESULT_SCAN
+            # of an INSERT only yields the row count.
+            params: Dict[str, object] = {
+                "user_id": self._default_user_id,
+                "week_id": week_id,
+                "session_date": payload.date,
+                "sport_id": payload.sport_id,
+                "category": payload.category,
+                "duration_minutes": payload.duration_minutes,
+                "intensity_rpe": payload.intensity_rpe,
+                "notes": payload.notes,
+                "session_dates": _session_dates_param({payload.date}),
             }
-            cursor.execute(insert_sql, activity_params)
-
-            fetch_sql = """
-                select
-                    activity_id,
-                    week_id,
-                    session_date,
-                    sport_id,
-                    category,
-                    duration_minutes,
-                    intensity_rpe,
-                    notes
-                from activity_sessions
-                where user_id = %(user_id)s
-                  and week_id = %(week_id)s
-                  and session_date = %(session_date)s
-                  and sport_id = %(sport_id)s
-                  and duration_minutes = %(duration_minutes)s
-                  and intensity_rpe = %(intensity_rpe)s
-                  and coalesce(category, '__NULL__') = coalesce(%(category)s, '__NULL__')
-                  and coalesce(notes, '__NULL__') = coalesce(%(notes)s, '__NULL__')
-                order by activity_id desc
-                limit 1
-            """
-            cursor.execute(fetch_sql, activity_params)
-            row = cursor.fetchone()
+            result_sets = self._fetch_result_sets_in_transaction(
+                cursor,
+                (_INSERT_ACTIVITY_SQL, _INSERTED_ACTIVITY_ID_SQL, *_RECOMPUTE_DAILY_LOADS_FOR_DATES),
+                params,
+            )
+            row = _first_row(result_sets[1])
             if not row:
                 raise SnowflakeServiceError("Unable to create activity session.")
 
-            normalized = self._normalize_row(row)
-            activity = Activity(
-                activity_id=int(normalized["activity_id"]),
-                week_id=int(normalized["week_id"]),
-                sport_id=int(normalized["sport_id"]),
-                date=normalized["session_date"],
-                category=normalized.get("category"),
-                duration_minutes=int(normalized["duration_minutes"]),
-                intensity_rpe=int(normalized["intensity_rpe"]),
-                notes=normalized.get("notes"),
+            # Everything but the generated id is already known from the payload.
+            return Activity.model_construct(
+                activity_id=int(row["activity_id"]),
+                week_id=week_id,
+                **payload.model_dump(),
             )
-            self._update_muscle_loads_for_activity(cursor, activity)
-            return activity
+
+    def create_activities_bulk(self, payloads: Sequence[ActivityCreate]) -> List[Activity]:
+        """Persist several activity sessions atomically.
+
+        Weeks are resolved once per distinct week. Each batch of up to
+        ``BULK_INSERT_BATCH_SIZE`` rows is one multi-row INSERT followed by
+        an id read-back keyed by row index, so ids never come from a
+        ``max(activity_id)`` probe that concurrent inserts could overtake.
+        The touched dates' daily loads are recomputed with the last batch.
+        A single batch carries its own BEGIN/COMMIT in the same request;
+        larger imports run every batch inside one ``_transaction``.
+        Returned activities follow the order of ``payloads``.
+        """
+        if not payloads:
+            return []
+
+        with self._cursor() as cursor:
+            week_ids: Dict[date, int] = {}
+            for week_start in sorted({start_of_week(payload.date) for payload in payloads}):
+                week_ids[week_start], _ = self._upsert_week(cursor, week_start)
+
+            batches = [
+                payloads[start : start + BULK_INSERT_BATCH_SIZE]
+                for start in range(0, len(payloads), BULK_INSERT_BATCH_SIZE)
+            ]
+            requests = [self._bulk_insert_request(batch, week_ids) for batch in batches]
+            last_statements, last_params = requests[-1]
+            last_params["session_dates"] = _session_dates_param({payload.date for payload in payloads})
+            requests[-1] = ([*last_statements, *_RECOMPUTE_DAILY_LOADS_FOR_DATES], last_params)
+
+            if len(requests) == 1:
+                id_results = [self._fetch_result_sets_in_transaction(cursor, *requests[0])[1]]
+            else:
+                with self._transaction(cursor):
+                    id_results = [self._fetch_result_sets(cursor, *request)[1] for request in requests]
+
+        activities: List[Activity] = []
+        for batch, (columns, rows) in zip(batches, id_results):
+            row_index_at, activity_id_at = columns["row_index"], columns["activity_id"]
+            ids = {int(row[row_index_at]): int(row[activity_id_at]) for row in rows}
+            for index, payload in enumerate(batch):
+                if index not in ids:
+                    raise SnowflakeServiceError("Unable to create activity session.")
+                activities.append(
+                    Activity.model_construct(
+                        activity_id=ids[index],
+                        week_id=week_ids[start_of_week(payload.date)],
+                        **payload.model_dump(),
+                    )
+                )
+        return activities
+
+    def _bulk_insert_request(
+        self, batch: Sequence[ActivityCreate], week_ids: Dict[date, int]
+    ) -> Tuple[List[str], Dict[str, object]]:
+        """Return the INSERT + id read-back statements and binds for one batch."""
+        params: Dict[str, object] = {"user_id": self._default_user_id}
+        for index, payload in enumerate(batch):
+            params.update(
+                {
+                    f"row{index}_week_id": week_ids[start_of_week(payload.date)],
+                    f"row{index}_session_date": payload.date,
+                    f"row{index}_sport_id": payload.sport_id,
+                    f"row{index}_category": payload.category,
+                    f"row{index}_duration_minutes": payload.duration_minutes,
+                    f"row{index}_intensity_rpe": payload.intensity_rpe,
+                    f"row{index}_notes": payload.notes,
+                }
+            )
+        return [_bulk_insert_activities_sql(len(batch)), _bulk_inserted_ids_sql(len(batch))], params
 
     def update_activity(self, activity_id: int, payload: ActivityUpdate) -> Activity:
         """Update an existing activity session for the default user."""
@@ -124,21 +645,8 @@ class SnowflakeService:
             if not existing:
                 raise SnowflakeServiceError("Activity not found.", status_code=404)
 
-            new_week_start = self._start_of_week(payload.date)
+            new_week_start = start_of_week(payload.date)
             new_week_id, _ = self._upsert_week(cursor, new_week_start)
-            update_sql = """
-                update activity_sessions
-                set
-                    week_id = %(week_id)s,
-                    session_date = %(session_date)s,
-                    sport_id = %(sport_id)s,
-                    category = %(category)s,
-                    duration_minutes = %(duration_minutes)s,
-                    intensity_rpe = %(intensity_rpe)s,
-                    notes = %(notes)s
-                where user_id = %(user_id)s
-                  and activity_id = %(activity_id)s
-            """
             params = {
                 "user_id": self._default_user_id,
                 "activity_id": activity_id,
@@ -150,17 +658,18 @@ class SnowflakeService:
                 "intensity_rpe": payload.intensity_rpe,
                 "notes": payload.notes,
             }
-            cursor.execute(update_sql, params)
-            if cursor.rowcount == 0:
-                raise SnowflakeServiceError("Activity not found.", status_code=404)
-
-            updated = self._fetch_activity_by_id(cursor, activity_id)
-            if not updated:
-                raise SnowflakeServiceError("Unable to load updated activity session.")
-
-            affected_dates: Set[date] = {existing.date}
-            affected_dates.add(updated.date)
-            self._refresh_daily_loads_for_dates(cursor, affected_dates)
+            with self._transaction(cursor):
+                cursor.execute(_UPDATE_ACTIVITY_SQL, params)
+                if cursor.rowcount == 0:
+                    raise SnowflakeServiceError("Activity not found.", status_code=404)
+
+                updated = self._fetch_activity_by_id(cursor, activity_id)
+                if not updated:
+                    raise SnowflakeServiceError("Unable to load updated activity session.")
+
+                affected_dates: Set[date] = {existing.date}
+                affected_dates.add(updated.date)
+                self._refresh_daily_loads_for_dates(cursor, affected_dates)
             return updated
 
     def delete_activity(self, activity_id: int) -> None:
@@ -170,30 +679,52 @@ class SnowflakeService:
             if not existing:
                 raise SnowflakeServiceError("Activity not found.", status_code=404)
 
-            cursor.execute(
-                """
-                delete from activity_sessions
-                where user_id = %(user_id)s
-                  and activity_id = %(activity_id)s
-                """,
-                {"user_id": self._default_user_id, "activity_id": activity_id},
-            )
-            if cursor.rowcount == 0:
-                raise SnowflakeServiceError("Activity not found.", status_code=404)
+            with self._transaction(cursor):
+                cursor.execute(
+                    _DELETE_ACTIVITY_SQL,
+                    {"user_id": self._default_user_id, "activity_id": activity_id},
+                )
+                if cursor.rowcount == 0:
+                    raise SnowflakeServiceError("Activity not found.", status_code=404)
 
-            self._refresh_daily_loads_for_dates(cursor, {existing.date})
+                self._refresh_daily_loads_for_dates(cursor, {existing.date})
 
     def get_week_summary(self, week_start_date: date) -> WeekSummary:
         """Fetch all activities + aggregates for a week."""
-        week_start = self._start_of_week(week_start_date)
+        week_start = start_of_week(week_start_date)
         week_end = week_start + timedelta(days=6)
 
         with self._cursor() as cursor:
-            week_id, label = self._get_week(cursor, week_start)  # still keeps weeks table tidy
-
-            activities = self._fetch_activities_by_date(cursor, week_start, week_end)
-            stats_dict = self._fetch_stats_by_range(cursor, week_start, week_end)
-            sport_breakdown = self._fetch_sport_breakdown_by_range(cursor, week_start, week_end)
+            result_sets = self._stream_result_sets(
+                cursor,
+                (
+                    _WEEK_BY_START_SQL,
+                    _ACTIVITIES_BY_RANGE_SQL,
+                    _SPORT_BREAKDOWN_BY_RANGE_SQL,
+                ),
+                {
+                    "user_id": self._default_user_id,
+                    "week_start_date": week_start,
+                    "start_date": week_start,
+                    "end_date": week_end,
+                },
+            )
+            week_row = _first_row(_materialize(next(result_sets)))
+            # Map activity rows as the connector downloads them. The breakdown
+            # has one row per sport and is re-read for the name lookup, so it is
+            # materialized; lookups run only once every set has been consumed.
+            activities = self._activities_from_result(next(result_sets))
+            breakdown_result = _materialize(next(result_sets))
+            if week_row:
+                label = week_row.get("label")
+                self._remember_week(week_start, (int(week_row["week_id"]), label))
+            else:
+                # Missing or legacy (non-Monday) week: re-anchor or raise as before.
+                _, label = self._get_week(cursor, week_start)
+            sport_breakdown = self._sport_breakdown_from_result(cursor, breakdown_result)
+        # The week's rows are already in memory; roll them up here instead of
+        # asking Snowflake to aggregate the same range again.
+        stats_dict = self._stats_from_activities(activities)
 
         return WeekSummary(
             week_start_date=week_start,
@@ -212,19 +743,34 @@ class SnowflakeService:
         self, start_date: date | None, end_date: date | None, lifetime: bool = False
     ) -> PeriodSummary:
         """Fetch aggregate metrics for an arbitrary date range or lifetime."""
+        if not lifetime and (not start_date or not end_date):
+            raise SnowflakeServiceError("start_date and end_date are required.", status_code=400)
+
         with self._cursor() as cursor:
             if lifetime:
-                start_date = self._fetch_earliest_activity_date(cursor)
-                end_date = self._fetch_latest_activity_date(cursor)
+                bounds_result, summary_result = self._fetch_result_sets(
+                    cursor,
+                    (_ACTIVITY_DATE_BOUNDS_SQL, _LIFETIME_SUMMARY_SQL),
+                    {"user_id": self._default_user_id},
+                )
+                bounds = _first_row(bounds_result) or {}
+                start_date, end_date = bounds.get("earliest_date"), bounds.get("latest_date")
                 if start_date is None or end_date is None:
                     today = date.today()
                     start_date = today
                     end_date = today  # no data yet; keep range valid
-            if not start_date or not end_date:
-                raise SnowflakeServiceError("start_date and end_date are required.", status_code=400)
+            else:
+                cursor.execute(
+                    _RANGE_SUMMARY_SQL,
+                    {
+                        "user_id": self._default_user_id,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                    },
+                )
+                summary_result = _read_result(cursor)
 
-            stats_dict = self._fetch_stats_by_range(cursor, start_date, end_date)
-            sport_breakdown = self._fetch_sport_breakdown_by_range(cursor, start_date, end_date)
+            stats_dict, sport_breakdown = self._range_summary_from_result(cursor, summary_result)
 
         label = f"{start_date} — {end_date}"
         return PeriodSummary(
@@ -240,132 +786,111 @@ class SnowflakeService:
         )
 
     def get_sports(self) -> List[Sport]:
-        """Return all sports with their associated focuses."""
+        """Return all sports with their associated focuses (cached in-process)."""
+        cached = self._sports_cache
+        if cached is None or time.monotonic() - cached[0] >= SPORTS_CACHE_TTL_SECONDS:
+            with self._sports_lock:
+                cached = self._sports_cache
+                if cached is None or time.monotonic() - cached[0] >= SPORTS_CACHE_TTL_SECONDS:
+                    cached = (time.monotonic(), self._fetch_sports())
+                    self._sports_cache = cached
+        return list(cached[1])
+
+    def _fetch_sports(self) -> List[Sport]:
         with self._cursor() as cursor:
-            cursor.execute(
-                """
-                select
-                    s.sport_id,
-                    s.name as sport_name,
-                    s.default_intensity_scale,
-                    f.focus_id,
-                    f.name as focus_name
-                from sports s
-                left join sport_focus f on f.sport_id = s.sport_id
-                order by s.sport_id asc, f.focus_id asc
-                """
-            )
-            rows = cursor.fetchall() or []
-
-        sports: "OrderedDict[int, dict[str, object]]" = OrderedDict()
+            cursor.execute(_SPORTS_WITH_FOCUSES_SQL)
+            columns, rows = _read_result(cursor)
+
+        sport_id_at = columns["sport_id"]
+        sport_name_at = columns["sport_name"]
+        scale_at = columns["default_intensity_scale"]
+        focus_id_at = columns["focus_id"]
+        focus_name_at = columns["focus_name"]
+        # One pass: build each Sport on first sight and append focuses to it.
+        construct_sport = Sport.model_construct
+        construct_focus = SportFocus.model_construct
+        sports: Dict[int, Sport] = {}
         for row in rows:
-            normalized = self._normalize_row(row)
-            sport_id = int(normalized["sport_id"])
-            sport_entry = sports.get(sport_id)
-            if not sport_entry:
-                sport_entry = {
-                    "sport_id": sport_id,
-                    "name": normalized["sport_name"],
-                    "default_intensity_scale": normalized.get("default_intensity_scale"),
-                    "focuses": [],
-                }
-                sports[sport_id] = sport_entry
-
-            focus_id = normalized.get("focus_id")
-            focus_name = normalized.get("focus_name")
-            if focus_id is not None and focus_name:
-                sport_entry["focuses"].append(
-                    SportFocus(
-                        focus_id=int(focus_id),
-                        sport_id=sport_id,
-                        name=focus_name,
-                    )
+            sport_id = int(row[sport_id_at])
+            sport = sports.get(sport_id)
+            if sport is None:
+                default_scale = row[scale_at]
+                sport = construct_sport(
+                    sport_id=sport_id,
+                    name=row[sport_name_at],
+                    default_intensity_scale=float(default_scale) if default_scale is not None else None,
+                    focuses=[],
                 )
+                sports[sport_id] = sport
 
-        result: List[Sport] = []
-        for entry in sports.values():
-            default_scale = entry.get("default_intensity_scale")
-            result.append(
-                Sport(
-                    sport_id=entry["sport_id"],
-                    name=entry["name"],
-                    default_intensity_scale=float(default_scale) if default_scale is not None else None,
-                    focuses=entry["focuses"],
+            focus_id = row[focus_id_at]
+            focus_name = row[focus_name_at]
+            if focus_id is not None and focus_name:
+                sport.focuses.append(
+                    construct_focus(focus_id=int(focus_id), sport_id=sport_id, name=focus_name)
                 )
-            )
-        return result
+        return list(sports.values())
 
     def get_muscle_load(self, week_start_date: date) -> MuscleLoadResponse:
         """Fetch aggregated muscle load data for a week."""
-        week_start = self._start_of_week(week_start_date)
+        week_start = start_of_week(week_start_date)
         week_end = week_start + timedelta(days=6)
         chronic_end = week_start - timedelta(days=1)
         chronic_start = chronic_end - timedelta(days=27)
 
         with self._cursor() as cursor:
-            load_sql = """
-                WITH windowed AS (
-                    SELECT muscle_id, date, load_score
-                    FROM daily_muscle_loads
-                    WHERE user_id = %(user_id)s
-                      AND date BETWEEN %(chronic_start)s AND %(week_end)s
-                ),
-                acute AS (
-                    SELECT muscle_id, SUM(load_score) AS acute_load
-                    FROM windowed
-                    WHERE date BETWEEN %(week_start)s AND %(week_end)s
-                    GROUP BY muscle_id
-                ),
-                chronic AS (
-                    SELECT muscle_id, SUM(load_score) AS chronic_load
-                    FROM windowed
-                    WHERE date BETWEEN %(chronic_start)s AND %(chronic_end)s
-                    GROUP BY muscle_id
-                )
-                SELECT
-                    a.muscle_id,
-                    m.name AS muscle_name,
-                    COALESCE(a.acute_load, 0) AS acute_load,
-                    COALESCE(c.chronic_load, 0) AS chronic_load
-                FROM acute a
-                JOIN muscle_groups m ON m.muscle_id = a.muscle_id
-                LEFT JOIN chronic c ON c.muscle_id = a.muscle_id
-                ORDER BY acute_load DESC
-            """
-            cursor.execute(
-                load_sql,
+            result_sets = self._stream_result_sets(
+                cursor,
+                (_MUSCLE_LOAD_SQL, _ATHLETE_PROFILE_SQL, _ACTIVITIES_BY_RANGE_SQL),
                 {
                     "user_id": self._default_user_id,
                     "week_start": week_start,
                     "week_end": week_end,
                     "chronic_start": chronic_start,
                     "chronic_end": chronic_end,
+                    "start_date": week_start,
+                    "end_date": week_end,
                 },
             )
-            rows = cursor.fetchall() or []
-            athlete_profile = self._fetch_athlete_profile(cursor)
-            fatigue_scores = self._compute_fatigue_scores(cursor, week_start, week_end)
-
-        muscles: List[MuscleLoad] = []
-        for row in rows:
-            normalized = self._normalize_row(row)
-            acute_load = float(normalized.get("acute_load") or 0.0)
-            chronic_total = float(normalized.get("chronic_load") or 0.0)
-            chronic_average = chronic_total / 4 if chronic_total > 0 else 0.0
-            divisor = chronic_average if chronic_average > 0 else max(acute_load, 1.0)
-            acwr = acute_load / divisor if divisor > 0 else 0.0
-            muscle_id = int(normalized["muscle_id"])
-            fatigue_score = fatigue_scores.get(muscle_id, 0.0)
-            muscles.append(
-                MuscleLoad(
-                    muscle_id=muscle_id,
-                    muscle_name=normalized["muscle_name"],
-                    load_score=acwr,
-                    load_category=color_for_muscle(normalized["muscle_name"], acwr),
-                    fatigue_score=fatigue_score,
-                    fatigue_category=fatigue_color_for_muscle(normalized["muscle_name"], fatigue_score),
-                )
+            # One row per muscle and one profile row are kept; the week's
+            # activities are mapped while streaming. The name, focus and config
+            # lookups reuse the cursor, so they wait until every set is read.
+            columns, rows = _materialize(next(result_sets))
+            athlete_profile = self._athlete_profile_from_row(_first_row(_materialize(next(result_sets))))
+            activities = self._activities_from_result(next(result_sets))
+            muscle_id_at = columns["muscle_id"]
+            muscle_names_by_id = self._lookup_names(
+                cursor, _MUSCLE_NAMES_SQL, (int(row[muscle_id_at]) for row in rows)
             )
+            fatigue_scores = self._compute_fatigue_scores(cursor, activities)
+
+        # Snowflake computes ACWR for every muscle; Python only slices columns
+        # and hands them to the batch classifiers. Muscles missing from
+        # muscle_groups are dropped, as the former inner join did.
+        acwr_at = columns["acwr"]
+        rows = [row for row in rows if int(row[muscle_id_at]) in muscle_names_by_id]
+        muscle_ids = [int(row[muscle_id_at]) for row in rows]
+        muscle_names = [muscle_names_by_id[muscle_id] for muscle_id in muscle_ids]
+        acwrs = [float(row[acwr_at] or 0.0) for row in rows]
+
+        fatigue_values = [fatigue_scores.get(muscle_id, 0.0) for muscle_id in muscle_ids]
+        load_categories = colors_for_muscles(muscle_names, acwrs)
+        fatigue_categories = fatigue_colors_for_muscles(muscle_names, fatigue_values)
+        # Values are computed here from typed Snowflake columns, so skip re-validation.
+        construct = MuscleLoad.model_construct
+        muscles = [
+            construct(
+                muscle_id=muscle_id,
+                muscle_name=muscle_name,
+                load_score=acwr,
+                load_category=load_category,
+                fatigue_score=fatigue_score,
+                fatigue_category=fatigue_category,
+            )
+            for muscle_id, muscle_name, acwr, load_category, fatigue_score, fatigue_category in zip(
+                muscle_ids, muscle_names, acwrs, load_categories, fatigue_values, fatigue_categories
+            )
+        ]
 
         return MuscleLoadResponse(
             week_start_date=week_start,
@@ -381,202 +906,122 @@ class SnowflakeService:
         if end_date < start_date:
             raise SnowflakeServiceError("end_date must be on or after start_date.")
 
+        # Delete, recompute and count in one transactional request; the rows
+        # never leave Snowflake.
         with self._cursor() as cursor:
-            cursor.execute(
-                """
-                delete from daily_muscle_loads
-                where user_id = %(user_id)s
-                  and date between %(start)s and %(end)s
-                """,
+            _, _, stats_result = self._fetch_result_sets_in_transaction(
+                cursor,
+                (_DELETE_DAILY_LOADS_BY_RANGE_SQL, _REBUILD_DAILY_LOADS_SQL, _STATS_BY_RANGE_SQL),
                 {
                     "user_id": self._default_user_id,
-                    "start": start_date,
-                    "end": end_date,
+                    "start_date": start_date,
+                    "end_date": end_date,
                 },
             )
-            activities = self._fetch_activities_by_date(cursor, start_date, end_date)
-            for activity in activities:
-                self._update_muscle_loads_for_activity(cursor, activity)
+        activity_count = self._stats_from_row(_first_row(stats_result))["session_count"]
 
         logger.info(
             "Rebuilt daily muscle loads for %s activities between %s and %s",
-            len(activities),
+            activity_count,
             start_date,
             end_date,
         )
-        return len(activities)
+        return activity_count
 
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
-    def _update_muscle_loads_for_activity(self, cursor: DictCursor, activity: Activity) -> None:
-        """Compute and persist daily muscle loads for the given activity."""
-        focus_id = self._resolve_focus_id(cursor, activity.sport_id, activity.category)
-        configs = self._fetch_muscle_load_configs(cursor, activity.sport_id, focus_id)
-        if not configs:
-            logger.debug(
-                "Skipping muscle load calc for sport_id=%s focus_id=%s (no configs)",
-                activity.sport_id,
-                focus_id,
-            )
-            return
-
-        for config in configs:
-            base_load = config.get("base_load_per_minute")
-            if base_load is None:
-                continue
-            load_value = muscle_load_score(
-                LoadInputs(
-                    duration_minutes=activity.duration_minutes,
-                    base_load_per_minute=float(base_load),
-                    intensity_rpe=activity.intensity_rpe,
-                    is_unilateral=bool(config.get("unilateral")),
-                    has_emphasis=bool(config.get("emphasis")),
-                )
-            )
-            self._upsert_daily_muscle_load(
-                cursor=cursor,
-                week_id=activity.week_id,
-                session_date=activity.date,
-                muscle_id=int(config["muscle_id"]),
-                load_score=load_value,
-            )
-
     def _resolve_focus_id(
         self,
-        cursor: DictCursor,
+        cursor: SnowflakeCursor,
         sport_id: int,
         category: str | None,
     ) -> int | None:
-        """Translate an activity category into a focus_id."""
+        """Translate an activity category into a focus_id.
+
+        The whole sport_focus table is small and rarely changes, so it is
+        loaded once per ``REFERENCE_CACHE_TTL_SECONDS`` instead of queried
+        per activity.
+        """
         if not category:
             return None
         trimmed = category.strip()
         if not trimmed:
             return None
-        cursor.execute(
-            """
-            select focus_id
-            from sport_focus
-            where sport_id = %(sport_id)s
-              and lower(name) = lower(%(focus_name)s)
-            limit 1
-            """,
-            {"sport_id": sport_id, "focus_name": trimmed},
-        )
-        row = cursor.fetchone()
-        if not row:
+        entry = self._focus_ids
+        now = time.monotonic()
+        if entry is None or now - entry[0] >= REFERENCE_CACHE_TTL_SECONDS:
+            cursor.execute(_FOCUS_IDS_SQL)
+            columns, rows = _read_result(cursor)
+            sport_id_at, name_at, focus_id_at = columns["sport_id"], columns["name"], columns["focus_id"]
+            focus_ids: Dict[Tuple[int, str], int] = {}
+            for row in rows:
+                # Keep the lowest focus_id per name, like the old ``limit 1`` lookup.
+                key = (int(row[sport_id_at]), row[name_at])
+                focus_id = int(row[focus_id_at])
+                if key not in focus_ids or focus_id < focus_ids[key]:
+                    focus_ids[key] = focus_id
+            entry = (now, focus_ids)
+            self._focus_ids = entry
+        focus_id = entry[1].get((sport_id, trimmed.lower()))
+        if focus_id is None:
             logger.debug(
                 "No focus matched for sport_id=%s category=%s",
                 sport_id,
                 trimmed,
             )
-            return None
-        normalized = self._normalize_row(row)
-        focus_value = normalized.get("focus_id")
-        return int(focus_value) if focus_value is not None else None
+        return focus_id
 
-    def _fetch_muscle_load_configs(
+    def _muscle_load_configs(
         self,
-        cursor: DictCursor,
+        cursor: SnowflakeCursor,
         sport_id: int,
         focus_id: int | None,
-    ) -> List[Dict[str, object]]:
-        """Return the muscle load configuration rows for the sport/focus."""
-        base_sql = """
-            select muscle_id, base_load_per_minute, emphasis, unilateral, focus_id
-            from sport_muscle_loads
-            where sport_id = %(sport_id)s
+    ) -> List[MuscleConfig]:
+        """Return cached muscle load configs for the sport/focus (treat as read-only).
+
+        Like the focus map, every sport/focus pair's configs are loaded once
+        per ``REFERENCE_CACHE_TTL_SECONDS``, so a cold cache costs one query
+        regardless of how many pairs a request touches. Focus priority is
+        resolved in SQL; a focus with no rows of its own uses the sport-wide
+        configs.
         """
-        params: Dict[str, object] = {"sport_id": sport_id}
-        if focus_id is None:
-            sql = base_sql + " and focus_id is null"
-        else:
-            sql = base_sql + " and (focus_id = %(focus_id)s or focus_id is null)"
-            params["focus_id"] = focus_id
-
-        cursor.execute(sql, params)
-        rows = cursor.fetchall() or []
-        if not rows:
-            return []
-
-        prioritized: Dict[int, Dict[str, object]] = {}
-        if focus_id is not None:
-            for row in rows:
-                normalized = self._normalize_row(row)
-                row_focus = normalized.get("focus_id")
-                if row_focus is None:
-                    continue
-                if int(row_focus) == focus_id:
-                    muscle_id = int(normalized["muscle_id"])
-                    normalized["muscle_id"] = muscle_id
-                    normalized["focus_id"] = focus_id
-                    prioritized[muscle_id] = normalized
+        entry = self._muscle_configs
+        now = time.monotonic()
+        if entry is None or now - entry[0] >= REFERENCE_CACHE_TTL_SECONDS:
+            entry = (now, self._fetch_muscle_load_configs(cursor))
+            self._muscle_configs = entry
+        resolved = entry[1]
+        configs = resolved.get((sport_id, focus_id))
+        if configs is None:
+            configs = resolved.get((sport_id, None), [])
+        return configs
 
+    def _fetch_muscle_load_configs(
+        self, cursor: SnowflakeCursor
+    ) -> Dict[Tuple[int, int | None], List[MuscleConfig]]:
+        """Return the chosen muscle load configs keyed by (sport_id, focus_id)."""
+        cursor.execute(_MUSCLE_LOAD_CONFIGS_SQL)
+        columns, rows = _read_result(cursor)
+        sport_id_at, for_focus_at = columns["sport_id"], columns["for_focus_id"]
+        muscle_id_at, focus_id_at = columns["muscle_id"], columns["focus_id"]
+        names = tuple(name for name in columns if name != "for_focus_id")
+        positions = tuple(columns[name] for name in names)
+        resolved: Dict[Tuple[int, int | None], List[MuscleConfig]] = {}
         for row in rows:
-            normalized = self._normalize_row(row)
-            muscle_id = int(normalized["muscle_id"])
-            normalized["muscle_id"] = muscle_id
-            row_focus = normalized.get("focus_id")
-            normalized["focus_id"] = int(row_focus) if row_focus is not None else None
-            if muscle_id in prioritized:
-                continue
-            if normalized["focus_id"] is None:
-                prioritized[muscle_id] = normalized
-
-        return list(prioritized.values())
-
-    def _upsert_daily_muscle_load(
-        self,
-        cursor: DictCursor,
-        week_id: int,
-        session_date: date,
-        muscle_id: int,
-        load_score: float,
-    ) -> None:
-        """Merge a single muscle load contribution into daily_muscle_loads."""
-        if load_score <= 0:
-            return
-
-        params = {
-            "user_id": self._default_user_id,
-            "week_id": week_id,
-            "session_date": session_date,
-            "muscle_id": muscle_id,
-            "load_score": load_score,
-        }
-        cursor.execute(
-            """
-            merge into daily_muscle_loads as target
-            using (
-                select
-                    %(user_id)s as user_id,
-                    %(week_id)s as week_id,
-                    %(session_date)s as session_date,
-                    %(muscle_id)s as muscle_id,
-                    %(load_score)s as load_score
-            ) as source
-            on target.user_id = source.user_id
-               and target.muscle_id = source.muscle_id
-               and target.date = source.session_date
-            when matched then update set
-                load_score = target.load_score + source.load_score,
-                week_id = source.week_id
-            when not matched then insert (user_id, week_id, date, muscle_id, load_score)
-            values (
-                source.user_id,
-                source.week_id,
-                source.session_date,
-                source.muscle_id,
-                source.load_score
-            )
-            """,
-            params,
-        )
+            config: MuscleConfig = {name: row[at] for name, at in zip(names, positions)}
+            config["sport_id"] = int(row[sport_id_at])
+            config["muscle_id"] = int(row[muscle_id_at])
+            row_focus = row[focus_id_at]
+            config["focus_id"] = int(row_focus) if row_focus is not None else None
+            for_focus = row[for_focus_at]
+            key = (config["sport_id"], int(for_focus) if for_focus is not None else None)
+            resolved.setdefault(key, []).append(config)
+        return resolved
 
     @contextmanager
-    def _cursor(self) -> Iterator[DictCursor]:
-        """Yield a DictCursor backed by a brand-new connection."""
+    def _cursor(self) -> Iterator[SnowflakeCursor]:
+        """Yield a tuple-row cursor on a connection obtained from the factory."""
         try:
             connection = self._connection_factory()
         except Exception as exc:  # pragma: no cover - depends on env
@@ -584,35 +1029,82 @@ class SnowflakeService:
 
         cursor = None
         try:
-            cursor = connection.cursor(DictCursor)
+            cursor = connection.cursor()
             yield cursor
         except SnowflakeConnectorError as exc:  # pragma: no cover
             raise SnowflakeServiceError(str(exc)) from exc
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._connection_release(connection)
+
+    @staticmethod
+    @contextmanager
+    def _transaction(cursor: SnowflakeCursor) -> Iterator[None]:
+        """Run the enclosed statements as one transaction with a single commit.
+
+        Outside an explicit transaction every DML statement autocommits, so a
+        write that touches ``activity_sessions`` and ``daily_muscle_loads``
+        would pay one commit per statement and could leave the loads stale if
+        a later statement failed.
+        """
+        cursor.execute("begin")
+        try:
+            yield
+            # A failed commit must roll back too, or the pooled connection is
+            # handed to its next borrower with the transaction still open.
+            cursor.execute("commit")
+        except BaseException:
+            SnowflakeService._rollback_quietly(cursor)
+            raise
+
+    @staticmethod
+    def _fetch_result_sets_in_transaction(
+        cursor: SnowflakeCursor,
+        statements: Sequence[str],
+        params: Dict[str, object],
+    ) -> List[ResultSet]:
+        """Like ``_fetch_result_sets``, with BEGIN/COMMIT inside the same request.
+
+        Only the result sets of ``statements`` are returned. Snowflake stops
+        executing the request at the first failing statement, so the open
+        transaction is rolled back before the error propagates.
+        """
+        try:
+            result_sets = SnowflakeService._fetch_result_sets(cursor, ("begin", *statements, "commit"), params)
+        except BaseException:
+            SnowflakeService._rollback_quietly(cursor)
+            raise
+        return result_sets[1:-1]
 
-    def _upsert_week(self, cursor: DictCursor, week_start: date) -> tuple[int, str | None]:
+    @staticmethod
+    def _rollback_quietly(cursor: SnowflakeCursor) -> None:
+        """Roll back a failed write without masking the error that caused it."""
+        try:
+            cursor.execute("rollback")
+        except Exception:
+            logger.warning("Rollback after a failed write also failed", exc_info=True)
+
+    def _upsert_week(self, cursor: SnowflakeCursor, week_start: date) -> tuple[int, str | None]:
         """Ensure week row exists for the given date and return (id, label)."""
         ensured = self._ensure_week_entry(cursor, week_start)
         if ensured:
             return ensured
 
-        merge_sql = """
-            merge into weeks as target
-            using (select %(user_id)s as user_id, %(week_start_date)s as week_start_date) as source
-            on target.user_id = source.user_id and target.week_start_date = source.week_start_date
-            when not matched then insert (user_id, week_start_date)
-            values (source.user_id, source.week_start_date)
-        """
-        cursor.execute(
-            merge_sql,
+        # Insert and read back the new row in a single request.
+        _, week_result = self._fetch_result_sets(
+            cursor,
+            (_WEEK_MERGE_SQL, _WEEK_BY_START_SQL),
             {"user_id": self._default_user_id, "week_start_date": week_start},
         )
-        return self._get_week(cursor, week_start)
+        row = _first_row(week_result)
+        if not row:
+            raise SnowflakeServiceError(
+                f"No training week found for {week_start.isoformat()}."
+            )
+        return self._remember_week(week_start, (int(row["week_id"]), row.get("label")))
 
-    def _get_week(self, cursor: DictCursor, week_start: date) -> tuple[int, str | None]:
+    def _get_week(self, cursor: SnowflakeCursor, week_start: date) -> tuple[int, str | None]:
         """Return (week_id, label) if the week exists."""
         ensured = self._ensure_week_entry(cursor, week_start)
         if not ensured:
@@ -621,320 +1113,249 @@ class SnowflakeService:
             )
         return ensured
 
-    def _ensure_week_entry(self, cursor: DictCursor, week_start: date) -> tuple[int, str | None] | None:
+    def _ensure_week_entry(self, cursor: SnowflakeCursor, week_start: date) -> tuple[int, str | None] | None:
         """Return an existing week row, re-anchoring legacy entries to Monday when needed."""
-        row = self._select_week_row(cursor, week_start)
-        if row:
-            normalized = self._normalize_row(row)
-            return int(normalized["week_id"]), normalized.get("label")
+        cached = self._cached_week(week_start)
+        if cached:
+            return cached
 
-        legacy_row = self._select_week_in_window(cursor, week_start)
-        if not legacy_row:
+        row = self._select_week_in_window(cursor, week_start)
+        if not row:
             return None
 
-        normalized = self._normalize_row(legacy_row)
-        stored_start: date = normalized["week_start_date"]
-        if stored_start != week_start:
-            self._reanchor_week(cursor, int(normalized["week_id"]), week_start)
-            row = self._select_week_row(cursor, week_start)
-            if row:
-                normalized = self._normalize_row(row)
-        return int(normalized["week_id"]), normalized.get("label")
-
-    def _select_week_row(self, cursor: DictCursor, week_start: date) -> Dict[str, object] | None:
+        week_id = int(row["week_id"])
+        if row["week_start_date"] != week_start:
+            # Re-anchoring only moves the start date; id and label are unchanged.
+            self._reanchor_week(cursor, week_id, week_start)
+        return self._remember_week(week_start, (week_id, row.get("label")))
+
+    def _cached_week(self, week_start: date) -> Tuple[int, str | None] | None:
+        key = (self._default_user_id, week_start)
+        with self._week_cache_lock:
+            entry = self._week_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= WEEK_CACHE_TTL_SECONDS:
+                del self._week_cache[key]
+                return None
+            self._week_cache.move_to_end(key)
+            return entry[1]
+
+    def _remember_week(self, week_start: date, week: Tuple[int, str | None]) -> Tuple[int, str | None]:
+        key = (self._default_user_id, week_start)
+        with self._week_cache_lock:
+            self._week_cache[key] = (time.monotonic(), week)
+            self._week_cache.move_to_end(key)
+            while len(self._week_cache) > WEEK_CACHE_MAX_ENTRIES:
+                self._week_cache.popitem(last=False)
+        return week
+
+    def _select_week_in_window(self, cursor: SnowflakeCursor, week_start: date) -> Dict[str, object] | None:
+        """Locate the week anchored on ``week_start`` or a legacy start in the same 7-day window."""
         cursor.execute(
-            """
-            select week_id, week_start_date, label
-            from weeks
-            where user_id = %(user_id)s
-              and week_start_date = %(week_start_date)s
-            """,
-            {"user_id": self._default_user_id, "week_start_date": week_start},
-        )
-        return cursor.fetchone()
-
-    def _select_week_in_window(self, cursor: DictCursor, week_start: date) -> Dict[str, object] | None:
-        """Locate a legacy week whose start date falls within the same 7-day window."""
-        cursor.execute(
-            """
-            select week_id, week_start_date, label
-            from weeks
-            where user_id = %(user_id)s
-              and week_start_date between %(window_start)s and %(window_end)s
-            order by week_start_date desc
-            limit 1
-            """,
+            _WEEK_IN_WINDOW_SQL,
             {
                 "user_id": self._default_user_id,
                 "window_start": week_start - timedelta(days=6),
                 "window_end": week_start,
             },
         )
-        return cursor.fetchone()
+        return _first_row(_read_result(cursor))
 
     @staticmethod
-    def _reanchor_week(cursor: DictCursor, week_id: int, week_start: date) -> None:
+    def _reanchor_week(cursor: SnowflakeCursor, week_id: int, week_start: date) -> None:
         """Update an existing week so that its anchor date is shifted to Monday."""
-        cursor.execute(
-            """
-            update weeks
-            set week_start_date = %(week_start_date)s
-            where week_id = %(week_id)s
-            """,
-            {"week_id": week_id, "week_start_date": week_start},
-        )
+        cursor.execute(_REANCHOR_WEEK_SQL, {"week_id": week_id, "week_start_date": week_start})
 
-    def _fetch_athlete_profile(self, cursor: DictCursor) -> AthleteProfile | None:
-        """Return the height/weight/DOB for the default user."""
-        cursor.execute(
-            """
-            select height_cm, weight_kg, date_of_birth
-            from users
-            where user_id = %(user_id)s
-            limit 1
-            """,
-            {"user_id": self._default_user_id},
-        )
-        row = cursor.fetchone()
+    def _athlete_profile_from_row(self, row: Dict[str, object] | None) -> AthleteProfile | None:
+        """Map a ``users`` row to the height/weight/DOB profile."""
         if not row:
             return None
-        normalized = self._normalize_row(row)
-        height_value = normalized.get("height_cm")
-        weight_value = normalized.get("weight_kg")
-        dob_value = normalized.get("date_of_birth")
+        height_value = row.get("height_cm")
+        weight_value = row.get("weight_kg")
+        dob_value = row.get("date_of_birth")
         return AthleteProfile(
             height_cm=float(height_value) if height_value is not None else None,
             weight_kg=float(weight_value) if weight_value is not None else None,
             date_of_birth=dob_value,
         )
 
-    def _fetch_activity_by_id(self, cursor: DictCursor, activity_id: int) -> Activity | None:
+    def _fetch_activity_by_id(self, cursor: SnowflakeCursor, activity_id: int) -> Activity | None:
         """Return a single activity row if it exists for the default user."""
         cursor.execute(
-            """
-            select
-                activity_id,
-                week_id,
-                session_date,
-                sport_id,
-                category,
-                duration_minutes,
-                intensity_rpe,
-                notes
-            from activity_sessions
-            where user_id = %(user_id)s
-              and activity_id = %(activity_id)s
-            limit 1
-            """,
+            _ACTIVITY_BY_ID_SQL,
             {"user_id": self._default_user_id, "activity_id": activity_id},
         )
-        row = cursor.fetchone()
-        if not row:
+        columns, rows = _read_result(cursor)
+        if not rows:
             return None
-        normalized = self._normalize_row(row)
-        return Activity(
-            activity_id=int(normalized["activity_id"]),
-            week_id=int(normalized["week_id"]),
-            sport_id=int(normalized["sport_id"]),
-            date=normalized["session_date"],
-            category=normalized.get("category"),
-            duration_minutes=int(normalized["duration_minutes"]),
-            intensity_rpe=int(normalized["intensity_rpe"]),
-            notes=normalized.get("notes"),
-        )
+        return Activity.from_db_row(rows[0], columns)
 
-    def _refresh_daily_loads_for_dates(self, cursor: DictCursor, dates: Set[date]) -> None:
-        """Recompute daily muscle loads for the provided dates."""
+    def _refresh_daily_loads_for_dates(self, cursor: SnowflakeCursor, dates: Set[date]) -> None:
+        """Recompute daily muscle loads for the provided dates inside Snowflake."""
         if not dates:
             return
-        for target_date in sorted(dates):
-            cursor.execute(
-                """
-                delete from daily_muscle_loads
-                where user_id = %(user_id)s
-                  and date = %(session_date)s
-                """,
-                {"user_id": self._default_user_id, "session_date": target_date},
-            )
-            activities = self._fetch_activities_by_date(cursor, target_date, target_date)
-            for activity in activities:
-                self._update_muscle_loads_for_activity(cursor, activity)
+        self._fetch_result_sets(
+            cursor,
+            _RECOMPUTE_DAILY_LOADS_FOR_DATES,
+            {"user_id": self._default_user_id, "session_dates": _session_dates_param(dates)},
+        )
 
     def _compute_fatigue_scores(
         self,
-        cursor: DictCursor,
-        week_start: date,
-        week_end: date,
+        cursor: SnowflakeCursor,
+        activities: List[Activity],
     ) -> Dict[int, float]:
-        """Return linear fatigue scores per muscle for the requested window."""
-        activities = self._fetch_activities_by_date(cursor, week_start, week_end)
+        """Return linear fatigue scores per muscle for the provided activities.
+
+        Fatigue is linear in ``duration * rpe``, so activities sharing a
+        sport/focus are summed first and each config row is applied once per
+        group rather than once per activity.
+        """
         if not activities:
             return {}
 
+        workloads: Dict[Tuple[int, int | None], float] = {}
+        for activity in activities:
+            key = (activity.sport_id, self._resolve_focus_id(cursor, activity.sport_id, activity.category))
+            workloads[key] = workloads.get(key, 0.0) + float(activity.duration_minutes) * activity.intensity_rpe
+
         scores: Dict[int, float] = {}
-        config_cache: Dict[Tuple[int, int | None], List[Dict[str, object]]] = {}
         baseline = BASELINE_RPE if BASELINE_RPE > 0 else 6.0
-
-        for activity in activities:
-            focus_id = self._resolve_focus_id(cursor, activity.sport_id, activity.category)
-            cache_key = (activity.sport_id, focus_id)
-            configs = config_cache.get(cache_key)
-            if configs is None:
-                configs = self._fetch_muscle_load_configs(cursor, activity.sport_id, focus_id)
-                config_cache[cache_key] = configs
-            if not configs:
-                continue
-
-            intensity_factor = activity.intensity_rpe / baseline
-            for config in configs:
+        for (sport_id, focus_id), workload in workloads.items():
+            scaled = workload / baseline
+            for config in self._muscle_load_configs(cursor, sport_id, focus_id):
                 base_value = config.get("base_load_per_minute")
                 if base_value is None:
                     continue
-                fatigue_value = float(activity.duration_minutes) * float(base_value) * intensity_factor
-                muscle_id = int(config["muscle_id"])
-                scores[muscle_id] = scores.get(muscle_id, 0.0) + fatigue_value
+                muscle_id = config["muscle_id"]
+                scores[muscle_id] = scores.get(muscle_id, 0.0) + float(base_value) * scaled
 
         return scores
 
-    def _fetch_activities_by_date(self, cursor: DictCursor, week_start: date, week_end: date) -> List[Activity]:
-        cursor.execute(
-            """
-            select
-                activity_id,
-                week_id,
-                session_date,
-                sport_id,
-                category,
-                duration_minutes,
-                intensity_rpe,
-                notes
-            from activity_sessions
-            where user_id = %(user_id)s
-              and session_date between %(week_start)s and %(week_end)s
-            order by session_date asc, activity_id asc
-            """,
-            {
-                "user_id": self._default_user_id,
-                "week_start": week_start,
-                "week_end": week_end,
-            },
-        )
-        rows = cursor.fetchall() or []
-        activities: List[Activity] = []
-        for row in rows:
-            normalized = self._normalize_row(row)
-            activities.append(
-                Activity(
-                    activity_id=int(normalized["activity_id"]),
-                    week_id=int(normalized["week_id"]),
-                    sport_id=int(normalized["sport_id"]),
-                    date=normalized["session_date"],
-                    category=normalized.get("category"),
-                    duration_minutes=int(normalized["duration_minutes"]),
-                    intensity_rpe=int(normalized["intensity_rpe"]),
-                    notes=normalized.get("notes"),
-                )
-            )
-        return activities
-
-    def _fetch_earliest_activity_date(self, cursor: DictCursor) -> date | None:
-        cursor.execute(
-            """
-            select min(session_date) as earliest_date
-            from activity_sessions
-            where user_id = %(user_id)s
-            """,
-            {"user_id": self._default_user_id},
-        )
-        row = cursor.fetchone() or {}
-        normalized = self._normalize_row(row)
-        return normalized.get("earliest_date")
+    def _activities_from_result(self, result: RowStream) -> List[Activity]:
+        columns, rows = result
+        from_db_row = Activity.from_db_row
+        return [from_db_row(row, columns) for row in rows]
+
+    def _range_summary_from_result(
+        self, cursor: SnowflakeCursor, result: ResultSet
+    ) -> Tuple[Dict[str, float], List[SportBreakdown]]:
+        """Split a GROUPING SETS summary into range stats and sport breakdown."""
+        columns, rows = result
+        is_total_at = columns["is_total"]
+        total_rows = [row for row in rows if row[is_total_at]]
+        sport_rows = [row for row in rows if not row[is_total_at]]
+        total = _first_row((columns, total_rows))
+        return self._stats_from_row(total), self._sport_breakdown_from_result(cursor, (columns, sport_rows))
 
-    def _fetch_latest_activity_date(self, cursor: DictCursor) -> date | None:
-        cursor.execute(
-            """
-            select max(session_date) as latest_date
-            from activity_sessions
-            where user_id = %(user_id)s
-            """,
-            {"user_id": self._default_user_id},
-        )
-        row = cursor.fetchone() or {}
-        normalized = self._normalize_row(row)
-        return normalized.get("latest_date")
+    @staticmethod
+    def _stats_from_activities(activities: Sequence[Activity]) -> Dict[str, float]:
+        session_count = len(activities)
+        total_duration = 0
+        total_rpe = 0
+        for activity in activities:
+            total_duration += activity.duration_minutes
+            total_rpe += activity.intensity_rpe
+        return {
+            "total_duration_minutes": total_duration,
+            "session_count": session_count,
+            "average_rpe": total_rpe / session_count if session_count else 0.0,
+        }
 
-    def _fetch_stats_by_range(self, cursor: DictCursor, start_date: date, end_date: date) -> Dict[str, float]:
-        cursor.execute(
-            """
-            select
-                coalesce(sum(duration_minutes), 0) as total_duration_minutes,
-                count(*) as session_count,
-                coalesce(avg(intensity_rpe), 0) as average_rpe
-            from activity_sessions
-            where user_id = %(user_id)s
-              and session_date between %(start_date)s and %(end_date)s
-            """,
-            {
-                "user_id": self._default_user_id,
-                "start_date": start_date,
-                "end_date": end_date,
-            },
-        )
-        row = cursor.fetchone() or {}
-        normalized = self._normalize_row(row)
+    def _stats_from_row(self, row: Dict[str, object] | None) -> Dict[str, float]:
+        normalized = row or {}
         return {
             "total_duration_minutes": int(normalized.get("total_duration_minutes", 0) or 0),
             "session_count": int(normalized.get("session_count", 0) or 0),
             "average_rpe": float(normalized.get("average_rpe", 0) or 0),
         }
 
-    def _fetch_sport_breakdown_by_range(
-        self, cursor: DictCursor, start_date: date, end_date: date
+    def _sport_breakdown_from_result(
+        self, cursor: SnowflakeCursor, result: ResultSet
     ) -> List[SportBreakdown]:
-        cursor.execute(
-            """
-            select
-                s.sport_id,
-                s.name as sport_name,
-                coalesce(sum(a.duration_minutes), 0) as total_duration_minutes,
-                count(a.activity_id) as session_count
-            from activity_sessions a
-            join sports s on s.sport_id = a.sport_id
-            where a.user_id = %(user_id)s
-              and a.session_date between %(start_date)s and %(end_date)s
-            group by s.sport_id, s.name
-            order by total_duration_minutes desc
-            """,
-            {
-                "user_id": self._default_user_id,
-                "start_date": start_date,
-                "end_date": end_date,
-            },
+        """Attach cached sport names to the join-free breakdown aggregate."""
+        columns, rows = result
+        sport_id_at = columns["sport_id"]
+        duration_at = columns["total_duration_minutes"]
+        count_at = columns["session_count"]
+        sport_names = self._lookup_names(
+            cursor, _SPORT_NAMES_SQL, (int(row[sport_id_at]) for row in rows)
         )
-        rows = cursor.fetchall() or []
-        breakdown: List[SportBreakdown] = []
-        for row in rows:
-            normalized = self._normalize_row(row)
-            breakdown.append(
-                SportBreakdown(
-                    sport_id=int(normalized["sport_id"]),
-                    sport_name=normalized["sport_name"],
-                    total_duration_minutes=int(normalized["total_duration_minutes"]),
-                    session_count=int(normalized["session_count"]),
-                )
+        construct = SportBreakdown.model_construct
+        return [
+            construct(
+                sport_id=int(row[sport_id_at]),
+                sport_name=sport_names[int(row[sport_id_at])],
+                total_duration_minutes=int(row[duration_at]),
+                session_count=int(row[count_at]),
             )
-        return breakdown
+            for row in rows
+            if int(row[sport_id_at]) in sport_names
+        ]
 
-    @staticmethod
-    def _start_of_week(target: date) -> date:
-        """Return the Monday of the week that contains the target date."""
-        return target - timedelta(days=target.weekday())
+    def _lookup_names(
+        self, cursor: SnowflakeCursor, sql: str, required_ids: Iterable[int]
+    ) -> Dict[int, str]:
+        """Return a cached id -> name map for a small reference table.
+
+        The map is reloaded when it expires or when ``required_ids`` contains
+        an id it has not seen yet (e.g. a sport added since the last load).
+        """
+        entry = self._reference_names.get(sql)
+        now = time.monotonic()
+        if (
+            entry is None
+            or now - entry[0] >= REFERENCE_CACHE_TTL_SECONDS
+            or any(required_id not in entry[1] for required_id in required_ids)
+        ):
+            cursor.execute(sql)
+            columns, rows = _read_result(cursor)
+            id_at, name_at = columns["id"], columns["name"]
+            entry = (now, {int(row[id_at]): row[name_at] for row in rows})
+            self._reference_names[sql] = entry
+        return entry[1]
 
     @staticmethod
-    def _normalize_row(row: Dict[str, object] | None) -> Dict[str, object]:
-        """Lowercase dict keys returned by Snowflake."""
-        if not row:
-            return {}
-        return {key.lower(): value for key, value in row.items()}
+    def _fetch_result_sets(
+        cursor: SnowflakeCursor,
+        statements: Sequence[str],
+        params: Dict[str, object],
+    ) -> List[ResultSet]:
+        """Run several statements in one multi-statement request.
+
+        Snowflake executes the statements in order and exposes one result set
+        per statement through ``nextset``, so the caller pays a single network
+        round trip instead of one per query.
+        """
+        cursor.execute(
+            ";\n".join(statement.strip() for statement in statements),
+            params,
+            num_statements=len(statements),
+        )
+        result_sets = [_read_result(cursor)]
+        while cursor.nextset():
+            result_sets.append(_read_result(cursor))
+        return result_sets
 
+    @staticmethod
+    def _stream_result_sets(
+        cursor: SnowflakeCursor,
+        statements: Sequence[str],
+        params: Dict[str, object],
+    ) -> Iterator[RowStream]:
+        """Like ``_fetch_result_sets``, but yield each set as a live stream.
+
+        Sets are yielded in statement order and each must be fully consumed
+        before the next is requested; the cursor must not run anything else
+        until the last one has been read.
+        """
+        cursor.execute(
+            ";\n".join(statement.strip() for statement in statements),
+            params,
+            num_statements=len(statements),
+        )
+        yield _stream_result(cursor)
+        while cursor.nextset():
+            yield _stream_result(cursor)
 
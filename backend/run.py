@@ -0,0 +1,20 @@
+"""Production entrypoint: multi-worker uvicorn on uvloop + httptools."""
+import os
+
+import uvicorn
+
+
+def main() -> None:
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "warning"),
+    )
+
+
+if __name__ == "__main__":
+    main()
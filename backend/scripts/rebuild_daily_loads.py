@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 from datetime import datetime, date
 
-from app.dependencies import get_snowflake_service
+from app.dependencies import build_snowflake_service
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -30,7 +30,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    service = get_snowflake_service()
+    service = build_snowflake_service()
     count = service.rebuild_daily_muscle_loads(args.start_date, args.end_date)
     end_date = args.end_date or args.start_date
 
@@ -0,0 +1,19 @@
+from typing import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Build the application once; tests swap collaborators via dependency overrides."""
+    return create_app()
+
+
+@pytest.fixture
+def client(app: FastAPI) -> Iterator[TestClient]:
+    yield TestClient(app)
+    app.dependency_overrides.clear()
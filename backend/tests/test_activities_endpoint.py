@@ -0,0 +1,45 @@
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import MAX_BULK_ACTIVITIES
+from app.dependencies import get_snowflake_service
+from app.schemas.activity import Activity, ActivityCreate
+
+
+class RecordingSnowflakeService:
+    def __init__(self) -> None:
+        self.bulk_sizes: list[int] = []
+
+    def create_activities_bulk(self, payloads: list[ActivityCreate]) -> list[Activity]:
+        self.bulk_sizes.append(len(payloads))
+        return [
+            Activity(activity_id=index + 1, week_id=7, **payload.model_dump())
+            for index, payload in enumerate(payloads)
+        ]
+
+
+def _payloads(count: int) -> list[dict]:
+    row = {"sport_id": 2, "date": date(2024, 1, 2).isoformat(), "duration_minutes": 30, "intensity_rpe": 5}
+    return [row] * count
+
+
+def test_bulk_create_accepts_imports_up_to_the_limit(app: FastAPI, client: TestClient) -> None:
+    service = RecordingSnowflakeService()
+    app.dependency_overrides[get_snowflake_service] = lambda: service
+
+    response = client.post("/api/activities/bulk", json=_payloads(MAX_BULK_ACTIVITIES))
+
+    assert response.status_code == 201
+    assert service.bulk_sizes == [MAX_BULK_ACTIVITIES]
+
+
+def test_bulk_create_rejects_imports_over_the_limit(app: FastAPI, client: TestClient) -> None:
+    service = RecordingSnowflakeService()
+    app.dependency_overrides[get_snowflake_service] = lambda: service
+
+    response = client.post("/api/activities/bulk", json=_payloads(MAX_BULK_ACTIVITIES + 1))
+
+    assert response.status_code == 422
+    assert service.bulk_sizes == []
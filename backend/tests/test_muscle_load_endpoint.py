@@ -1,9 +1,10 @@
 from datetime import date, timedelta
 
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.dependencies import get_snowflake_service
-from app.main import create_app
+from app.dependencies import get_response_cache, get_snowflake_service
+from app.schemas.activity import Activity, ActivityCreate
 from app.schemas.muscle import MuscleLoad, MuscleLoadResponse
 
 
@@ -18,16 +19,15 @@ class FakeSnowflakeService:
                     muscle_name="Quads",
                     load_score=1.1,
                     load_category="green",
+                    fatigue_category="white",
                 )
             ],
         )
 
 
-def test_muscle_load_endpoint_returns_payload() -> None:
-    app = create_app()
+def test_muscle_load_endpoint_returns_payload(app: FastAPI, client: TestClient) -> None:
     app.dependency_overrides[get_snowflake_service] = lambda: FakeSnowflakeService()
 
-    client = TestClient(app)
     response = client.get("/api/muscle-load/2024-01-01")
 
     assert response.status_code == 200
@@ -36,3 +36,121 @@ def test_muscle_load_endpoint_returns_payload() -> None:
     assert payload["week_end_date"] == "2024-01-07"
     assert payload["muscles"][0]["muscle_name"] == "Quads"
     assert payload["muscles"][0]["load_category"] == "green"
+
+
+class FakeCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self.entries[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.entries.pop(key, None)
+
+    async def invalidate(self, *patterns: str) -> None:
+        self.entries.clear()
+
+
+class CountingSnowflakeService(FakeSnowflakeService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_muscle_load(self, week_start_date: date) -> MuscleLoadResponse:
+        self.calls += 1
+        return super().get_muscle_load(week_start_date)
+
+    def create_activity(self, payload: ActivityCreate) -> Activity:
+        return Activity(activity_id=1, week_id=7, **payload.model_dump())
+
+
+def test_muscle_load_endpoint_serves_repeat_requests_from_cache(app: FastAPI, client: TestClient) -> None:
+    service = CountingSnowflakeService()
+    cache = FakeCache()
+    app.dependency_overrides[get_snowflake_service] = lambda: service
+    app.dependency_overrides[get_response_cache] = lambda: cache
+
+    first = client.get("/api/muscle-load/2024-01-01")
+    second = client.get("/api/muscle-load/2024-01-01")
+
+    assert first.json() == second.json()
+    assert service.calls == 1
+    version = cache.entries["version:1"].decode()
+    assert f"muscle-load:1:2024-01-01:{version}" in cache.entries
+
+
+def test_muscle_load_endpoint_returns_not_modified_for_matching_etag(app: FastAPI, client: TestClient) -> None:
+    app.dependency_overrides[get_snowflake_service] = lambda: FakeSnowflakeService()
+
+    first = client.get("/api/muscle-load/2024-01-01")
+    etag = first.headers["etag"]
+    second = client.get("/api/muscle-load/2024-01-01", headers={"If-None-Match": etag})
+    stale = client.get("/api/muscle-load/2024-01-01", headers={"If-None-Match": '"stale"'})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+
+def test_muscle_load_etag_is_checked_before_querying_when_a_cache_holds_the_version(
+    app: FastAPI, client: TestClient
+) -> None:
+    service = CountingSnowflakeService()
+    cache = FakeCache()
+    app.dependency_overrides[get_snowflake_service] = lambda: service
+    app.dependency_overrides[get_response_cache] = lambda: cache
+
+    first = client.get("/api/muscle-load/2024-01-01")
+    etag = first.headers["etag"]
+    cache.entries.pop(f"muscle-load:1:2024-01-01:{cache.entries['version:1'].decode()}")
+    revalidated = client.get("/api/muscle-load/2024-01-01", headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert service.calls == 1
+
+    client.post(
+        "/api/activities",
+        json={"sport_id": 2, "date": "2024-01-02", "duration_minutes": 30, "intensity_rpe": 5},
+    )
+    after_write = client.get("/api/muscle-load/2024-01-01", headers={"If-None-Match": etag})
+
+    assert after_write.status_code == 200
+    assert after_write.headers["etag"] != etag
+    assert service.calls == 2
+
+
+class WriteDuringReadService(CountingSnowflakeService):
+    """Lands a write (bumping the version) while the first read is querying."""
+
+    def __init__(self, cache: FakeCache) -> None:
+        super().__init__()
+        self._cache = cache
+
+    def get_muscle_load(self, week_start_date: date) -> MuscleLoadResponse:
+        response = super().get_muscle_load(week_start_date)
+        if self.calls == 1:
+            self._cache.entries["version:1"] = b"after-write"
+        return response
+
+
+def test_read_overlapping_a_write_does_not_cache_its_body_under_the_new_version(
+    app: FastAPI, client: TestClient
+) -> None:
+    cache = FakeCache()
+    service = WriteDuringReadService(cache)
+    app.dependency_overrides[get_snowflake_service] = lambda: service
+    app.dependency_overrides[get_response_cache] = lambda: cache
+
+    overlapping = client.get("/api/muscle-load/2024-01-01")
+    after_write = client.get("/api/muscle-load/2024-01-01")
+
+    # The pre-write body was stored under the old version, so this read queries.
+    assert service.calls == 2
+    assert after_write.headers["etag"] == '"v-after-write"'
+    assert overlapping.headers["etag"] != after_write.headers["etag"]
@@ -0,0 +1,62 @@
+import pytest
+
+from app.config.muscles import (
+    color_for_muscle,
+    colors_for_muscles,
+    fatigue_color_for_muscle,
+    fatigue_colors_for_muscles,
+)
+
+
+@pytest.mark.parametrize(
+    ("acwr", "expected"),
+    [
+        (0.0, "white"),
+        (0.69, "blue"),
+        (0.7, "green"),
+        (1.4, "green"),
+        (1.41, "yellow"),
+        (1.8, "yellow"),
+        (2.3, "orange"),
+        (2.31, "red"),
+    ],
+)
+def test_color_for_muscle_tier_a_boundaries(acwr: float, expected: str) -> None:
+    assert color_for_muscle("Core", acwr) == expected
+
+
+def test_color_for_muscle_defaults_unknown_muscles_to_tier_b() -> None:
+    assert color_for_muscle("Unknown", 0.79) == "blue"
+    assert color_for_muscle("Unknown", 0.8) == "green"
+    assert color_for_muscle("Unknown", 1.81) == "red"
+
+
+@pytest.mark.parametrize(
+    ("score", "expected"),
+    [
+        (0.0, "white"),
+        (29.9, "blue"),
+        (30.0, "green"),
+        (90.0, "green"),
+        (150.0, "yellow"),
+        (210.0, "orange"),
+        (210.5, "red"),
+    ],
+)
+def test_fatigue_color_for_muscle_tier_c_boundaries(score: float, expected: str) -> None:
+    assert fatigue_color_for_muscle(" Chest ", score) == expected
+
+
+def test_batch_colors_match_scalar_helpers() -> None:
+    names = ["Core", "Quads", "Chest", "Unknown"]
+    values = [0.65, 1.45, 1.45, 0.0]
+
+    assert colors_for_muscles(names, values) == [
+        color_for_muscle(name, value) for name, value in zip(names, values)
+    ]
+    assert fatigue_colors_for_muscles(names, [59.0, 135.0, 91.0, 0.0]) == [
+        "blue",
+        "green",
+        "yellow",
+        "white",
+    ]
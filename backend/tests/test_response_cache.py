@@ -0,0 +1,29 @@
+import asyncio
+
+from app.services.cache import MemoryCache
+
+
+def test_memory_cache_evicts_least_recently_used_and_invalidates_patterns() -> None:
+    async def scenario() -> None:
+        cache = MemoryCache(max_entries=2)
+        await cache.set("week:1:2024-01-01", b"a", ttl_seconds=60)
+        await cache.set("muscle-load:1:2024-01-01", b"b", ttl_seconds=60)
+        assert await cache.get("week:1:2024-01-01") == b"a"
+
+        await cache.set("sports:v1", b"c", ttl_seconds=60)
+        assert await cache.get("muscle-load:1:2024-01-01") is None
+
+        await cache.invalidate("week:1:*")
+        assert await cache.get("week:1:2024-01-01") is None
+        assert await cache.get("sports:v1") == b"c"
+
+    asyncio.run(scenario())
+
+
+def test_memory_cache_caps_ttl() -> None:
+    async def scenario() -> None:
+        cache = MemoryCache(max_ttl_seconds=0)
+        await cache.set("week:1:2024-01-01", b"a", ttl_seconds=86400)
+        assert await cache.get("week:1:2024-01-01") is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,119 @@
+import anyio
+import pytest
+
+from app import main
+from app.db.session import SnowflakePool
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self._connection = connection
+
+    def execute(self, sql: str) -> None:
+        self._connection.pings += 1
+        if self._connection.broken:
+            raise RuntimeError("connection reset")
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.broken = False
+        self.pings = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeCreator:
+    def __init__(self) -> None:
+        self.created: list[FakeConnection] = []
+
+    def __call__(self) -> FakeConnection:
+        connection = FakeConnection()
+        self.created.append(connection)
+        return connection
+
+
+def test_pool_reuses_released_connections() -> None:
+    creator = FakeCreator()
+    pool = SnowflakePool(creator, pool_size=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(creator.created) == 1
+
+
+def test_pool_times_out_when_exhausted() -> None:
+    pool = SnowflakePool(FakeCreator(), pool_size=1, pool_timeout=0.01)
+    pool.acquire()
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_pool_closes_overflow_connections_on_release() -> None:
+    creator = FakeCreator()
+    pool = SnowflakePool(creator, pool_size=1, max_overflow=1)
+
+    first = pool.acquire()
+    overflow = pool.acquire()
+    pool.release(first)
+    pool.release(overflow)
+
+    assert overflow.closed
+    assert not first.closed
+    assert pool.max_connections == 2
+
+
+def test_pool_replaces_connections_that_fail_pre_ping() -> None:
+    creator = FakeCreator()
+    pool = SnowflakePool(creator, pool_size=1, pre_ping_after=0.0)
+
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.broken = True
+    fresh = pool.acquire()
+
+    assert fresh is not stale
+    assert stale.closed
+    assert len(creator.created) == 2
+
+
+def test_pool_recycles_old_connections() -> None:
+    creator = FakeCreator()
+    pool = SnowflakePool(creator, pool_size=1, pool_recycle=0.0)
+
+    old = pool.acquire()
+    pool.release(old)
+    new = pool.acquire()
+
+    assert new is not old
+    assert old.closed
+
+
+def test_app_lifespan_closes_the_pool_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    creator = FakeCreator()
+    pool = SnowflakePool(creator, pool_size=1)
+    pool.release(pool.acquire())
+    monkeypatch.setattr(main, "get_snowflake_pool", lambda: pool)
+
+    async def run_lifespan() -> None:
+        async with main.lifespan(main.app):
+            pass
+
+    anyio.run(run_lifespan)
+
+    assert creator.created[0].closed
@@ -0,0 +1,571 @@
+from datetime import date
+from typing import Iterator
+
+import pytest
+
+from app.schemas.activity import Activity, ActivityCreate
+from app.services.errors import SnowflakeServiceError
+from app.services import snowflake as snowflake_module
+from app.services.snowflake import (
+    SnowflakeService,
+    _REBUILD_DAILY_LOADS_SQL,
+    _REFRESH_DAILY_LOADS_SQL,
+    _SPORT_NAMES_SQL,
+)
+
+ResultSpec = tuple[tuple[str, ...], list[tuple]]
+
+
+class ScriptedCursor:
+    """Return canned result sets, one list of sets per ``execute`` call."""
+
+    def __init__(self, responses: list[list[ResultSpec]]) -> None:
+        self._responses = responses
+        self._sets: list[ResultSpec] = []
+        self.executed: list[tuple[str, dict, int | None]] = []
+        # SQL of every request whose rows were read with ``fetchall``.
+        self.fetched: list[str] = []
+
+    def execute(self, sql: str, params: dict | None = None, num_statements: int | None = None) -> None:
+        self.executed.append((sql, params or {}, num_statements))
+        self._sets = self._responses.pop(0)
+
+    @property
+    def description(self) -> list[tuple[str]]:
+        return [(name,) for name in self._sets[0][0]] if self._sets else []
+
+    def fetchall(self) -> list[tuple]:
+        self.fetched.append(self.executed[-1][0])
+        return self._rows()
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self._rows())
+
+    def _rows(self) -> list[tuple]:
+        return self._sets[0][1] if self._sets else []
+
+    def nextset(self) -> bool | None:
+        self._sets = self._sets[1:]
+        return True if self._sets else None
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self, cursor: ScriptedCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> ScriptedCursor:
+        return self._cursor
+
+    def close(self) -> None:
+        pass
+
+
+# Result set Snowflake returns for BEGIN / COMMIT inside a multi-statement request.
+STATEMENT_OK: ResultSpec = (("status",), [("Statement executed successfully.",)])
+
+CONFIG_COLUMNS = (
+    "SPORT_ID",
+    "FOR_FOCUS_ID",
+    "MUSCLE_ID",
+    "BASE_LOAD_PER_MINUTE",
+    "EMPHASIS",
+    "UNILATERAL",
+    "FOCUS_ID",
+)
+
+ACTIVITY_COLUMNS = (
+    "ACTIVITY_ID",
+    "WEEK_ID",
+    "SESSION_DATE",
+    "SPORT_ID",
+    "CATEGORY",
+    "DURATION_MINUTES",
+    "INTENSITY_RPE",
+    "NOTES",
+)
+
+
+def test_week_summary_reads_week_activities_and_breakdown_in_one_request() -> None:
+    week_start = date(2024, 1, 1)
+    cursor = ScriptedCursor(
+        [
+            [
+                (("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(7, week_start, "Base")]),
+                (
+                    ACTIVITY_COLUMNS,
+                    [(1, 7, week_start, 2, None, 45, 6, None), (2, 7, week_start, 2, None, 30, 7, None)],
+                ),
+                (("SPORT_ID", "TOTAL_DURATION_MINUTES", "SESSION_COUNT"), [(2, 75, 2)]),
+            ],
+            [(("ID", "NAME"), [(2, "Run")])],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    summary = service.get_week_summary(week_start)
+
+    assert cursor.executed[0][2] == 3
+    # The week request's sets are iterated, never fetchall'd.
+    assert cursor.executed[0][0] not in cursor.fetched
+    assert summary.label == "Base"
+    assert [activity.activity_id for activity in summary.activities] == [1, 2]
+    assert summary.activities[0].duration_minutes == 45
+    assert summary.stats.total_duration_minutes == 75
+    assert summary.stats.session_count == 2
+    assert summary.stats.average_rpe == 6.5
+    assert summary.stats.sport_breakdown[0].sport_name == "Run"
+
+
+def test_muscle_load_maps_acwr_rows_and_fatigue_configs() -> None:
+    week_start = date(2024, 1, 1)
+    cursor = ScriptedCursor(
+        [
+            [
+                (
+                    ("MUSCLE_ID", "ACWR"),
+                    [(3, 1.2), (99, 0.5)],
+                ),
+                (("HEIGHT_CM", "WEIGHT_KG", "DATE_OF_BIRTH"), [(180, 75, None)]),
+                (ACTIVITY_COLUMNS, [(1, 7, week_start, 2, None, 60, 6, None)]),
+            ],
+            [(("ID", "NAME"), [(3, "Quads")])],
+            [
+                (
+                    CONFIG_COLUMNS,
+                    [(2, None, 3, 1.5, False, False, None)],
+                ),
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    response = service.get_muscle_load(week_start)
+
+    assert cursor.executed[0][2] == 3
+    assert cursor.executed[0][0] not in cursor.fetched
+    assert len(response.muscles) == 1
+    muscle = response.muscles[0]
+    assert muscle.muscle_name == "Quads"
+    assert muscle.load_score == 1.2
+    assert muscle.fatigue_score == 90.0
+    assert response.athlete_profile is not None
+    assert response.athlete_profile.height_cm == 180.0
+
+
+def test_week_lookup_is_cached_after_first_fetch() -> None:
+    week_start = date(2024, 1, 1)
+    cursor = ScriptedCursor(
+        [[(("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(7, week_start, "Base")])]]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service._get_week(cursor, week_start) == (7, "Base")
+    assert service._get_week(cursor, week_start) == (7, "Base")
+    assert len(cursor.executed) == 1
+
+
+def test_upsert_week_merges_and_reads_back_in_one_request() -> None:
+    week_start = date(2024, 1, 8)
+    week_columns = ("WEEK_ID", "WEEK_START_DATE", "LABEL")
+    cursor = ScriptedCursor(
+        [
+            [(week_columns, [])],
+            [
+                (("number of rows inserted",), [(1,)]),
+                (week_columns, [(9, week_start, None)]),
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service._upsert_week(cursor, week_start) == (9, None)
+    assert cursor.executed[-1][2] == 2
+    assert len(cursor.executed) == 2
+
+
+def test_upsert_week_reanchors_legacy_start_without_reselecting() -> None:
+    week_start = date(2024, 1, 8)
+    cursor = ScriptedCursor(
+        [
+            [(("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(5, date(2024, 1, 7), "Old")])],
+            [(("number of rows updated",), [(1,)])],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service._upsert_week(cursor, week_start) == (5, "Old")
+    assert len(cursor.executed) == 2
+    assert cursor.executed[1][1] == {"week_id": 5, "week_start_date": week_start}
+
+
+BULK_PAYLOADS = [
+    ActivityCreate(sport_id=2, date=date(2024, 1, 3), duration_minutes=30, intensity_rpe=5),
+    ActivityCreate(sport_id=2, date=date(2024, 1, 2), duration_minutes=45, intensity_rpe=6),
+]
+WEEK_ROW: ResultSpec = (("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(7, date(2024, 1, 1), None)])
+RECOMPUTED_LOADS = [(("number of rows deleted",), [(0,)]), (("number of rows inserted",), [(2,)])]
+
+
+def test_bulk_create_inserts_all_rows_at_once_and_maps_ids_by_row_index() -> None:
+    cursor = ScriptedCursor(
+        [
+            [WEEK_ROW],
+            [
+                STATEMENT_OK,
+                (("number of rows inserted",), [(2,)]),
+                (("ROW_INDEX", "ACTIVITY_ID"), [(1, 12), (0, 11)]),
+                *RECOMPUTED_LOADS,
+                STATEMENT_OK,
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    activities = service.create_activities_bulk(BULK_PAYLOADS)
+
+    assert [activity.activity_id for activity in activities] == [11, 12]
+    assert [activity.date for activity in activities] == [date(2024, 1, 3), date(2024, 1, 2)]
+    assert len(cursor.executed) == 2
+    sql, params, num_statements = cursor.executed[1]
+    # begin, multi-row insert, id read-back, daily-load delete + insert, commit
+    assert num_statements == 6
+    assert sql.startswith("begin;") and sql.endswith("commit")
+    assert params["row0_session_date"] == date(2024, 1, 3)
+    assert params["row1_duration_minutes"] == 45
+    assert params["session_dates"] == ["2024-01-02", "2024-01-03"]
+
+
+def test_bulk_create_splits_large_imports_into_batches_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(snowflake_module, "BULK_INSERT_BATCH_SIZE", 1)
+    inserted = (("number of rows inserted",), [(1,)])
+    cursor = ScriptedCursor(
+        [
+            [WEEK_ROW],
+            [STATEMENT_OK],
+            [inserted, (("ROW_INDEX", "ACTIVITY_ID"), [(0, 11)])],
+            [inserted, (("ROW_INDEX", "ACTIVITY_ID"), [(0, 12)]), *RECOMPUTED_LOADS],
+            [STATEMENT_OK],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    activities = service.create_activities_bulk(BULK_PAYLOADS)
+
+    assert [activity.activity_id for activity in activities] == [11, 12]
+    assert [(sql, num_statements) for sql, _, num_statements in cursor.executed[1:2] + cursor.executed[4:]] == [
+        ("begin", None),
+        ("commit", None),
+    ]
+    assert [num_statements for _, _, num_statements in cursor.executed[2:4]] == [2, 4]
+
+
+def test_sport_names_are_loaded_once_and_reloaded_for_unknown_ids() -> None:
+    names = [(("ID", "NAME"), [(2, "Run")])]
+    cursor = ScriptedCursor([names, [(("ID", "NAME"), [(2, "Run"), (5, "Swim")])]])
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service._lookup_names(cursor, _SPORT_NAMES_SQL, [2]) == {2: "Run"}
+    assert service._lookup_names(cursor, _SPORT_NAMES_SQL, [2]) == {2: "Run"}
+    assert len(cursor.executed) == 1
+    assert service._lookup_names(cursor, _SPORT_NAMES_SQL, [5])[5] == "Swim"
+    assert len(cursor.executed) == 2
+
+
+def test_create_activity_inserts_reads_id_and_recomputes_loads_in_one_transaction() -> None:
+    week_start = date(2024, 1, 1)
+    cursor = ScriptedCursor(
+        [
+            [(("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(7, week_start, None)])],
+            [
+                STATEMENT_OK,
+                (("number of rows inserted",), [(1,)]),
+                (("ACTIVITY_ID",), [(42,)]),
+                (("number of rows deleted",), [(0,)]),
+                (("number of rows inserted",), [(1,)]),
+                STATEMENT_OK,
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+    payload = ActivityCreate(
+        sport_id=2, date=date(2024, 1, 3), duration_minutes=30, intensity_rpe=5, notes="easy"
+    )
+
+    activity = service.create_activity(payload)
+
+    assert len(cursor.executed) == 2
+    sql, params, num_statements = cursor.executed[1]
+    assert num_statements == 6
+    assert sql.startswith("begin;") and sql.endswith("commit")
+    assert _REFRESH_DAILY_LOADS_SQL.strip() in sql
+    assert params["session_date"] == date(2024, 1, 3)
+    assert params["session_dates"] == ["2024-01-03"]
+    assert activity.activity_id == 42
+    assert activity.week_id == 7
+    assert activity.notes == "easy"
+    assert activity.date == date(2024, 1, 3)
+
+
+def test_create_and_rebuild_share_one_daily_load_rule() -> None:
+    # No SQL engine runs under test, so create/rebuild parity is held by both
+    # paths sending the same statement, differing only in which sessions match.
+    rebuild_filter = "s.session_date between %(start_date)s and %(end_date)s"
+    refresh_filter = "s.session_date in (%(session_dates)s)"
+
+    assert rebuild_filter in _REBUILD_DAILY_LOADS_SQL
+    assert _REBUILD_DAILY_LOADS_SQL.replace(rebuild_filter, refresh_filter) == _REFRESH_DAILY_LOADS_SQL
+
+
+def test_daily_load_sql_picks_the_focus_row_before_dropping_empty_base_loads() -> None:
+    # A focus row with a NULL base must win the QUALIFY and contribute nothing,
+    # not be filtered out early so the sport-wide row takes its place.
+    # The base only feeds the load_score product; rows are dropped on that
+    # product after the QUALIFY.
+    _, after_qualify = _REBUILD_DAILY_LOADS_SQL.split("qualify", 1)
+    assert _REBUILD_DAILY_LOADS_SQL.count("base_load_per_minute") == 1
+    assert "load_score > 0" in after_qualify
+
+
+def test_focus_lookup_strips_surrounding_whitespace_and_ignores_case() -> None:
+    cursor = ScriptedCursor([[(("SPORT_ID", "NAME", "FOCUS_ID"), [(2, "tempo", 5)])]])
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service._resolve_focus_id(cursor, 2, "\tTempo\n") == 5
+    assert service._resolve_focus_id(cursor, 2, " \n ") is None
+
+
+def test_refresh_recomputes_affected_dates_in_one_request() -> None:
+    cursor = ScriptedCursor(
+        [[(("number of rows deleted",), [(4,)]), (("number of rows inserted",), [(5,)])]]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    service._refresh_daily_loads_for_dates(cursor, {date(2024, 1, 9), date(2024, 1, 2)})
+
+    assert len(cursor.executed) == 1
+    sql, params, num_statements = cursor.executed[0]
+    assert num_statements == 2
+    assert "session_date in (%(session_dates)s)" in sql
+    assert params["session_dates"] == ["2024-01-02", "2024-01-09"]
+
+
+def test_refresh_and_create_send_the_same_daily_load_recompute() -> None:
+    write_cursor = ScriptedCursor(
+        [
+            [(("WEEK_ID", "WEEK_START_DATE", "LABEL"), [(7, date(2024, 1, 1), None)])],
+            [
+                STATEMENT_OK,
+                (("number of rows inserted",), [(1,)]),
+                (("ACTIVITY_ID",), [(42,)]),
+                (("number of rows deleted",), [(0,)]),
+                (("number of rows inserted",), [(1,)]),
+                STATEMENT_OK,
+            ],
+        ]
+    )
+    refresh_cursor = ScriptedCursor([[]])
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(write_cursor), default_user_id=1)
+
+    service.create_activity(ActivityCreate(sport_id=2, date=date(2024, 1, 3), duration_minutes=30, intensity_rpe=5))
+    service._refresh_daily_loads_for_dates(refresh_cursor, {date(2024, 1, 3)})
+
+    create_sql, create_params, _ = write_cursor.executed[1]
+    refresh_sql, refresh_params, _ = refresh_cursor.executed[0]
+    assert create_sql.endswith(f";\n{refresh_sql};\ncommit")
+    assert create_params["session_dates"] == refresh_params["session_dates"]
+
+
+def test_rebuild_recomputes_daily_loads_server_side() -> None:
+    cursor = ScriptedCursor(
+        [
+            [
+                STATEMENT_OK,
+                (("number of rows deleted",), [(12,)]),
+                (("number of rows inserted",), [(9,)]),
+                (("TOTAL_DURATION_MINUTES", "SESSION_COUNT", "AVERAGE_RPE"), [(240, 4, 6.5)]),
+                STATEMENT_OK,
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    assert service.rebuild_daily_muscle_loads(date(2024, 1, 1), date(2024, 1, 7)) == 4
+
+    # The delete and the re-insert commit together, in the same request.
+    assert len(cursor.executed) == 1
+    sql, params, num_statements = cursor.executed[0]
+    assert num_statements == 5
+    assert sql.startswith("begin;") and sql.endswith("commit")
+    assert "insert into daily_muscle_loads" in sql
+    assert params == {"user_id": 1, "start_date": date(2024, 1, 1), "end_date": date(2024, 1, 7)}
+
+
+def test_period_summary_splits_grouping_sets_into_totals_and_breakdown() -> None:
+    columns = ("IS_TOTAL", "SPORT_ID", "TOTAL_DURATION_MINUTES", "SESSION_COUNT", "AVERAGE_RPE")
+    cursor = ScriptedCursor(
+        [
+            [(columns, [(1, None, 150, 3, 6.0), (0, 2, 90, 2, 5.5), (0, 4, 60, 1, 7.0)])],
+            [(("ID", "NAME"), [(2, "Run"), (4, "Swim")])],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    summary = service.get_period_summary(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert "grouping sets" in cursor.executed[0][0]
+    assert summary.stats.total_duration_minutes == 150
+    assert summary.stats.session_count == 3
+    assert summary.stats.average_rpe == 6.0
+    assert [(item.sport_name, item.total_duration_minutes) for item in summary.stats.sport_breakdown] == [
+        ("Run", 90),
+        ("Swim", 60),
+    ]
+
+
+def test_lifetime_summary_reads_bounds_and_totals_in_one_request() -> None:
+    columns = ("IS_TOTAL", "SPORT_ID", "TOTAL_DURATION_MINUTES", "SESSION_COUNT", "AVERAGE_RPE")
+    cursor = ScriptedCursor(
+        [
+            [
+                (("EARLIEST_DATE", "LATEST_DATE"), [(date(2023, 5, 1), date(2024, 2, 3))]),
+                (columns, [(1, None, 90, 2, 5.5), (0, 2, 90, 2, 5.5)]),
+            ],
+            [(("ID", "NAME"), [(2, "Run")])],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    summary = service.get_period_summary(None, None, lifetime=True)
+
+    assert cursor.executed[0][2] == 2
+    assert (summary.start_date, summary.end_date) == (date(2023, 5, 1), date(2024, 2, 3))
+    assert summary.stats.session_count == 2
+    assert [item.sport_name for item in summary.stats.sport_breakdown] == ["Run"]
+
+
+def test_get_sports_groups_focuses_in_one_pass() -> None:
+    columns = ("SPORT_ID", "SPORT_NAME", "DEFAULT_INTENSITY_SCALE", "FOCUS_ID", "FOCUS_NAME")
+    cursor = ScriptedCursor(
+        [[(columns, [(1, "Run", 1, 10, "Tempo"), (1, "Run", 1, 11, "Long"), (2, "Swim", None, None, None)])]]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    sports = service.get_sports()
+
+    assert [(sport.sport_id, sport.default_intensity_scale) for sport in sports] == [(1, 1.0), (2, None)]
+    assert [focus.name for focus in sports[0].focuses] == ["Tempo", "Long"]
+    assert sports[1].focuses == []
+
+
+def test_transaction_rolls_back_when_the_body_raises() -> None:
+    cursor = ScriptedCursor([[], []])
+
+    with pytest.raises(SnowflakeServiceError):
+        with SnowflakeService._transaction(cursor):
+            raise SnowflakeServiceError("Activity not found.", status_code=404)
+
+    assert [sql for sql, _, _ in cursor.executed] == ["begin", "rollback"]
+
+
+class FailingCursor(ScriptedCursor):
+    """Record statements like ScriptedCursor, but raise for SQL starting with ``failing``."""
+
+    def __init__(self, *failing: str) -> None:
+        super().__init__([])
+        self._failing = failing
+
+    def execute(self, sql: str, params: dict | None = None, num_statements: int | None = None) -> None:
+        self.executed.append((sql, params or {}, num_statements))
+        self._sets = []
+        if sql.startswith(self._failing):
+            raise RuntimeError(f"failed: {sql}")
+
+
+def test_transaction_keeps_the_original_error_when_rollback_fails() -> None:
+    cursor = FailingCursor("rollback")
+
+    with pytest.raises(SnowflakeServiceError, match="Activity not found."):
+        with SnowflakeService._transaction(cursor):
+            raise SnowflakeServiceError("Activity not found.", status_code=404)
+
+    assert [sql for sql, _, _ in cursor.executed] == ["begin", "rollback"]
+
+
+def test_transaction_rolls_back_when_the_commit_fails() -> None:
+    cursor = FailingCursor("commit")
+
+    with pytest.raises(RuntimeError, match="failed: commit"):
+        with SnowflakeService._transaction(cursor):
+            cursor.execute("delete from activity_sessions")
+
+    assert [sql for sql, _, _ in cursor.executed] == ["begin", "delete from activity_sessions", "commit", "rollback"]
+
+
+def test_failed_transactional_request_is_rolled_back() -> None:
+    cursor = FailingCursor("begin;")
+
+    with pytest.raises(RuntimeError, match="failed: begin;"):
+        SnowflakeService._fetch_result_sets_in_transaction(cursor, ("select 1",), {})
+
+    assert [sql for sql, _, _ in cursor.executed][-1] == "rollback"
+
+
+def test_fatigue_scores_sum_activities_sharing_a_sport() -> None:
+    cursor = ScriptedCursor(
+        [
+            [
+                (
+                    CONFIG_COLUMNS,
+                    [(2, None, 3, 1.5, False, False, None), (2, None, 4, 0.5, False, False, None)],
+                )
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+    day = date(2024, 1, 2)
+    activities = [
+        Activity(activity_id=1, week_id=7, sport_id=2, date=day, duration_minutes=60, intensity_rpe=6),
+        Activity(activity_id=2, week_id=7, sport_id=2, date=day, duration_minutes=30, intensity_rpe=3),
+    ]
+
+    scores = service._compute_fatigue_scores(cursor, activities)
+
+    # 60 min @ RPE 6 plus 30 min @ RPE 3 is 75 baseline-minutes.
+    assert scores == {3: 112.5, 4: 37.5}
+    assert len(cursor.executed) == 1
+
+
+def test_configs_load_once_and_fall_back_to_sport_wide_rows() -> None:
+    # Rows as the QUALIFY returns them: one per muscle for each (sport, focus).
+    cursor = ScriptedCursor(
+        [
+            [
+                (
+                    CONFIG_COLUMNS,
+                    [
+                        (2, None, 3, 1.0, False, False, None),
+                        (2, None, 4, 0.5, False, False, None),
+                        (2, 5, 3, 1.4, True, False, 5),
+                        (2, 5, 4, 0.5, False, False, None),
+                        (8, None, 3, 0.2, False, False, None),
+                    ],
+                )
+            ],
+        ]
+    )
+    service = SnowflakeService(connection_factory=lambda: FakeConnection(cursor), default_user_id=1)
+
+    focused = service._muscle_load_configs(cursor, 2, 5)
+    sport_wide = service._muscle_load_configs(cursor, 2, None)
+    unconfigured_focus = service._muscle_load_configs(cursor, 2, 9)
+
+    assert {(c["muscle_id"], c["base_load_per_minute"]) for c in focused} == {(3, 1.4), (4, 0.5)}
+    assert {(c["muscle_id"], c["base_load_per_minute"]) for c in sport_wide} == {(3, 1.0), (4, 0.5)}
+    assert unconfigured_focus == sport_wide
+    assert "for_focus_id" not in focused[0]
+    assert service._muscle_load_configs(cursor, 7, None) == []
+    assert len(cursor.executed) == 1
+    assert "qualify row_number()" in cursor.executed[0][0]